@@ -0,0 +1,62 @@
+"""
+JSON load/dump for the cheat database scripts: orjson when installed, stdlib json otherwise.
+Both work on bytes, so callers open files in binary mode.
+"""
+
+import io
+import mmap
+
+try:
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj, compact=False) -> bytes:
+        if compact:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def dump(obj, f, compact=False):
+        """Write obj to binary file f (orjson serialises in one shot, in C)."""
+        f.write(dumps(obj, compact))
+
+    def load_path(path):
+        """Parse a JSON file straight from a read-only memory map."""
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file cannot be mapped
+                return orjson.loads(f.read())
+            try:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            finally:
+                mm.close()
+
+except ImportError:
+    import json
+
+    def _dump_kwargs(compact):
+        if compact:
+            return {'ensure_ascii': False, 'separators': (',', ':')}
+        return {'indent': 2, 'ensure_ascii': False}
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj, compact=False) -> bytes:
+        return json.dumps(obj, **_dump_kwargs(compact)).encode('utf-8')
+
+    def dump(obj, f, compact=False):
+        """Write obj to binary file f chunk by chunk, without building the whole document."""
+        text = io.TextIOWrapper(f, encoding='utf-8', newline='', write_through=True)
+        try:
+            json.dump(obj, text, **_dump_kwargs(compact))
+            text.flush()
+        finally:
+            text.detach()
+
+    def load_path(path):
+        with open(path, 'rb') as f:
+            return json.loads(f.read())
@@ -232,6 +232,11 @@ def parse_gamehacking_html(html: str, key: str):
     return out
 
 
+_HEX_WORD = re.compile(r'[0-9A-Fa-f]{1,8}')
+_HEX8 = re.compile(r'\b[0-9A-Fa-f]{8}\b')
+_CODE_SEPARATORS = str.maketrans(':\t,', '   ')
+
+
 def _normalize_code_lines(lines):
     """Take raw lines (strings) and normalize to RAW 8x8 pairs or PNACH patch lines.
     Returns a list of normalized code strings (RAW pairs like 'XXXXXXXX YYYYYYYY' or PNACH lines).
@@ -246,20 +251,18 @@ def _normalize_code_lines(lines):
             out.append(s)
             continue
         # remove common prefixes/tokens
-        s2 = s.replace(':', ' ').replace('\t', ' ').replace(',', ' ').strip()
-        parts = [p for p in s2.split() if p]
-        if len(parts) >= 2 and re.fullmatch(r'[0-9A-Fa-f]{1,8}', parts[0]) and re.fullmatch(r'[0-9A-Fa-f]{1,8}', parts[1]):
+        parts = s.translate(_CODE_SEPARATORS).split()
+        if len(parts) >= 2 and _HEX_WORD.fullmatch(parts[0]) and _HEX_WORD.fullmatch(parts[1]):
             addr = parts[0].upper().rjust(8, '0')
             val = parts[1].upper().rjust(8, '0')
             out.append(f"{addr} {val}")
             continue
         # Some codes are given as groups separated by spaces; attempt to find any 8-hex tokens
-        hexs = re.findall(r'\b[0-9A-Fa-f]{8}\b', s)
+        hexs = _HEX8.findall(s)
         if len(hexs) >= 2:
-            # pair them sequentially
-            for i in range(0, len(hexs)-1, 2):
-                a = hexs[i].upper(); v = hexs[i+1].upper()
-                out.append(f"{a} {v}")
+            # pair them sequentially (an odd trailing word is dropped)
+            it = iter(hexs)
+            out.extend(f"{a.upper()} {v.upper()}" for a, v in zip(it, it))
             continue
         # Otherwise keep raw line as fallback
         out.append(s)
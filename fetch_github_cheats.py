@@ -22,6 +22,21 @@ logger = logging.getLogger(__name__)
 GITHUB_REPO = "https://github.com/xs1l3n7x/pcsx2_cheats_collection"
 GITHUB_ZIP_URL = "https://github.com/xs1l3n7x/pcsx2_cheats_collection/archive/refs/heads/main.zip"
 
+# One multiline scan over a whole .pnach instead of strip/startswith per line.
+# Each match is a (trimmed) line of interest: header value, [section], codeN= value or patch= line.
+PNACH_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'gametitle=[^\S\n]*(?P<gametitle>[^\n]*?)'
+    r'|serial=[^\S\n]*(?P<serial>[^\n]*?)'
+    r'|\[(?P<section>[^\n]*)\]'
+    r'|code\d+=[^\S\n]*(?P<code>[^\n]*?)'
+    r'|(?P<patch>patch=[^\n]*?)'
+    r')[^\S\n]*$',
+    re.M
+)
+PNACH_CRC_LINE_RE = re.compile(r'^.*(?:CRC|crc).*$', re.M)
+HEX8_RE = re.compile(r'[0-9A-Fa-f]{8}')
+
 
 class PnachParser:
     """Parse PCSX2 .pnach cheat files."""
@@ -63,40 +78,28 @@ class PnachParser:
             'cheats': []
         }
         
-        lines = content.split('\n')
         current_cheat = None
         
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('//'):
-                continue
+        for m in PNACH_LINE_RE.finditer(content):
+            kind = m.lastgroup
+            value = m.group(kind)
             
             # Parse header info
-            if line.startswith('gametitle='):
-                result['gametitle'] = line.split('=', 1)[1].strip()
-            elif line.startswith('serial='):
-                result['serial'] = line.split('=', 1)[1].strip()
-            elif line.startswith('cheats='):
-                continue  # Just a count
-            elif line.startswith('[') and line.endswith(']'):
+            if kind == 'gametitle' or kind == 'serial':
+                result[kind] = value
+            elif kind == 'section':
                 # New cheat section
                 if current_cheat and current_cheat.get('codes'):
                     result['cheats'].append(current_cheat)
-                cheat_name = line[1:-1].strip()
+                cheat_name = value.strip()
                 cheat_name = cheat_name.replace('Cheats/', '', 1) if cheat_name.startswith('Cheats/') else cheat_name
                 current_cheat = {
                     'name': cheat_name,
                     'codes': []
                 }
-            elif current_cheat and (line.startswith('code') or line.startswith('patch=')):
-                # Parse cheat code - handle both code= and patch= formats
-                if line.startswith('code'):
-                    code_match = re.match(r'code\d+=(.+)', line)
-                    if code_match:
-                        current_cheat['codes'].append(code_match.group(1).strip())
-                elif line.startswith('patch='):
-                    # Add patch line as-is (it's already a complete code)
-                    current_cheat['codes'].append(line)
+            elif current_cheat and value:
+                # codeN= value, or a patch= line as-is (it's already a complete code)
+                current_cheat['codes'].append(value)
         
         # Add last cheat
         if current_cheat:
@@ -108,11 +111,10 @@ class PnachParser:
     def extract_crc_from_pnach_content(content: str) -> Optional[str]:
         """Extract CRC from PNACH file if available."""
         # Look for CRC in comments or metadata
-        for line in content.split('\n'):
-            if 'CRC' in line or 'crc' in line:
-                match = re.search(r'[0-9A-Fa-f]{8}', line)
-                if match:
-                    return match.group(0).upper()
+        for line in PNACH_CRC_LINE_RE.finditer(content):
+            match = HEX8_RE.search(line.group())
+            if match:
+                return match.group(0).upper()
         return None
 
 
@@ -18,11 +18,11 @@ import re
 import json
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any
-from collections import deque
+from collections import deque, defaultdict, OrderedDict
 import time
 import logging
 
-from PySide6.QtCore import Qt, QThread, Signal, QSize, QSettings, QTimer
+from PySide6.QtCore import Qt, QThread, Signal, SIGNAL, QSize, QSettings, QTimer, QAbstractTableModel, QModelIndex
 import sys
 from PySide6.QtGui import QIcon, QPixmap, QDragEnterEvent, QDropEvent, QAction, QPainter, QColor, QPen
 import concurrent.futures
@@ -117,6 +117,17 @@ PNACH_PATCH_LINE = re.compile(
 TITLE_LINE = re.compile(r"^\s*gametitle\s*=\s*(.+)$", re.IGNORECASE)
 CRC_IN_TEXT = re.compile(r"\bCRC\s*[:=]\s*(?:0x)?([0-9A-Fa-f]{8})\b")
 INI_BOOL = re.compile(r"^(true|false|enabled|disabled|1|0)$", re.I)
+# Loose CRC/serial hints in file names (Bulk tab)
+_FNAME_CRC_RE = re.compile(r"([0-9A-Fa-f]{8})")
+_FNAME_CRC_RE_BYTES = re.compile(rb"([0-9A-Fa-f]{8})")
+# TITLE_LINE | CRC_IN_TEXT | SERIAL_RE as one alternation, so the Bulk scan walks each file once
+_BULK_FIELDS_RE = re.compile(
+    r"^[^\S\r\n]*(?i:gametitle)[^\S\r\n]*=[^\S\r\n]*(?P<title>[^\r\n]+)"
+    r"|\bCRC\s*[:=]\s*(?:0x)?(?P<crc>[0-9A-Fa-f]{8})\b"
+    r"|(?P<serial>(?i:\b(?:SCUS|SLUS|SLES|SCES|SLPS|SLPM|SCPS|SCAJ|SLKA|ULUS|UCUS|PBPX|PAPX|TCUS|TCES)[-_ ]?\d{3,6}\b))",
+    re.MULTILINE,
+)
+_FNAME_SERIAL_RE = re.compile(r"([A-Z]{4,5}[-_ ]?\d{3,5})", re.IGNORECASE)
 
 
 @dataclass
@@ -679,16 +690,21 @@ def parse_pnach_text(text: str) -> PnachData:
     return pd
 
 
+# RAW code separators turned into spaces before splitting, and the value half of a RAW pair
+_RAW_SEPARATORS = str.maketrans(",=\t", "   ")
+_RAW_VALUE = re.compile(r"[0-9A-Fa-f]{1,8}")
+
+
 def parse_raw_8x8(text: str) -> List[Tuple[str, str]]:
     pairs: List[Tuple[str, str]] = []
-    for i, line in enumerate(text.splitlines(), 1):
+    for line in text.splitlines():
         s = line.strip()
         if not s or s.startswith(("#", "//", ";")):
             continue
-        s = s.replace(",", " ").replace("=", " ").replace("\t", " ")
-        parts = [p for p in s.split() if p]
+        # only the first two words matter
+        parts = s.translate(_RAW_SEPARATORS).split(None, 2)
         # Accept patterns like: XXXXXXXX Y, XXXXXXXX YYYY, XXXXXXXX YYYYYYYY
-        if len(parts) >= 2 and HEX8.match(parts[0]) and re.fullmatch(r"[0-9A-Fa-f]{1,8}", parts[1]):
+        if len(parts) >= 2 and HEX8.match(parts[0]) and _RAW_VALUE.fullmatch(parts[1]):
             addr = parts[0].upper()
             val = parts[1].upper().rjust(8, "0")  # pad to 8
             pairs.append((addr, val))
@@ -2755,6 +2771,9 @@ class TexturesTab(QWidget):
                     except Exception:
                         pass
                     try:
+                        # this 'finished' is emitted from inside run(); let run() return before
+                        # the thread object is deleted, or Qt aborts on destroying a running QThread
+                        self.wait()
                         self.deleteLater()
                     except Exception:
                         pass
@@ -3990,6 +4009,9 @@ class TexturesTab(QWidget):
         # Process events periodically to keep UI responsive
         from PySide6.QtWidgets import QApplication
         process_counter = 0
+        # top-level items whose path is the base folder itself (the list is sorted, so keep
+        # the items rather than their row numbers)
+        _base_items = []
 
         def contains_images(d: str, depth=2) -> bool:
             exts = ('.png', '.jpg', '.jpeg', '.bmp', '.tga')
@@ -4056,6 +4078,7 @@ class TexturesTab(QWidget):
                 except Exception:
                     pass
                 self.packs_list.addTopLevelItem(it)
+                _base_items.append(it)
 
         # helper: check shallow images (direct files in base or a direct 'replacements' child)
         def _contains_images_shallow(d: str) -> bool:
@@ -4167,6 +4190,8 @@ class TexturesTab(QWidget):
             except Exception:
                 pass
             self.packs_list.addTopLevelItem(it)
+            if pack_dir == base:
+                _base_items.append(it)
             return
         def contains_images(d: str, depth=2) -> bool:
             exts = ('.png', '.jpg', '.jpeg', '.bmp', '.tga')
@@ -4390,12 +4415,15 @@ class TexturesTab(QWidget):
             if contains_images(target):
                 # display name should be relative to base to help identify nested packs
                 display = os.path.relpath(target, base)
+                base_name = os.path.basename(display)
+                m_serial = SERIAL_RE.search(base_name)
+                is_hex = bool(HEX8.match(base_name))
                 # cache key needs safe name (no path separators)
                 safe_key = display.replace(os.sep, '_')
                 thumb = self._make_thumbnail(target, safe_key)
                 # If display looks like a serial, try to resolve title and prefer showing the full title
-                if SERIAL_RE.search(os.path.basename(display)) and not HEX8.match(os.path.basename(display)):
-                    serial = os.path.basename(display)
+                if m_serial and not is_hex:
+                    serial = base_name
                     mapping = getattr(self.parent.cheats_tab, 'mapping', {}) or {}
                     title = None
                     kU = serial.upper().strip()
@@ -4410,8 +4438,8 @@ class TexturesTab(QWidget):
                     item_text = display
                 title_col = ""
                 try:
-                    if SERIAL_RE.search(os.path.basename(display)) and not HEX8.match(os.path.basename(display)):
-                        kU = os.path.basename(display).upper().strip()
+                    if m_serial and not is_hex:
+                        kU = base_name.upper().strip()
                         mapping = getattr(self.parent.cheats_tab, 'mapping', {}) or {}
                         title_col = mapping.get(kU) or mapping.get(norm_serial_key(kU)) or ""
                         try:
@@ -4454,22 +4482,18 @@ class TexturesTab(QWidget):
 
         # After full listing, print diagnostics and resolve titles for items missing Title column
         try:
-            # If we detected serial/CRC child folders, remove any top-level item that points to the base folder
+            # If we detected serial/CRC child folders, remove the top-level item that points to the base folder
             try:
                 if has_serial_children:
-                    # remove matching items (iterate backwards)
-                    for idx in range(self.packs_list.topLevelItemCount()-1, -1, -1):
-                        itm = self.packs_list.topLevelItem(idx)
+                    for itm in _base_items:
+                        idx = self.packs_list.indexOfTopLevelItem(itm)
+                        if idx < 0:
+                            continue
                         try:
-                            pth = itm.data(0, Qt.UserRole)
-                            if isinstance(pth, str) and os.path.abspath(pth) == os.path.abspath(base):
-                                try:
-                                    logger.debug(f"[TexturesTab] removing base-as-pack item at index {idx} (path='{pth}')")
-                                except Exception:
-                                    pass
-                                self.packs_list.takeTopLevelItem(idx)
+                            logger.debug(f"[TexturesTab] removing base-as-pack item at index {idx} (path='{base}')")
                         except Exception:
-                            continue
+                            pass
+                        self.packs_list.takeTopLevelItem(idx)
             except Exception:
                 pass
             # Diagnostic: enumerate all items we added so we can see what display/title/path they have
@@ -4488,8 +4512,7 @@ class TexturesTab(QWidget):
             except Exception:
                 pass
 
-            keys = []
-            item_map = {}
+            item_map = defaultdict(list)
             for i in range(self.packs_list.topLevelItemCount()):
                 itm = self.packs_list.topLevelItem(i)
                 if not itm:
@@ -4513,9 +4536,8 @@ class TexturesTab(QWidget):
                     except Exception:
                         cand = None
                 if cand:
-                    if cand not in keys:
-                        keys.append(cand)
-                    item_map.setdefault(cand, []).append(itm)
+                    item_map[cand].append(itm)
+            keys = list(item_map.keys())
 
             if keys:
                 try:
@@ -4895,8 +4917,7 @@ class TexturesTab(QWidget):
 
     def _resolve_all_packs(self):
         # Collect unresolved serials from the list and run ResolveWorker in bulk
-        keys = []
-        item_map = {}
+        item_map = defaultdict(list)
         for i in range(self.packs_list.topLevelItemCount()):
             itm = self.packs_list.topLevelItem(i)
             if not itm: continue
@@ -4918,9 +4939,8 @@ class TexturesTab(QWidget):
                 except Exception:
                     cand = None
             if cand:
-                if cand not in keys:
-                    keys.append(cand)
-                item_map.setdefault(cand, []).append(itm)
+                item_map[cand].append(itm)
+        keys = list(item_map.keys())
 
         if not keys:
             QMessageBox.information(self, 'Resolve All', 'No unresolved serial-named packs found.')
@@ -5045,95 +5065,304 @@ class TexturesTab(QWidget):
         return None
 
 
+_BULK_READ_CHUNK = 1 << 16
+_SEP = os.sep
+_ALTSEP = os.altsep or os.sep
+
+
+def _basename(p: str) -> str:
+    # os.path.basename for the Bulk hot paths, minus the per-call normalisation
+    return p[max(p.rfind(_SEP), p.rfind(_ALTSEP)) + 1:]
+
+
+def _bulk_read_text(p: str) -> Tuple[str, int]:
+    # Cheat files are a few KB: raw os.read + one decode skips the buffered text-IO setup of open().
+    # Also returns the file's mtime (ns) so a cached copy of the text can be checked for staleness.
+    fd = os.open(p, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        mtime = os.fstat(fd).st_mtime_ns
+        parts = []
+        while True:
+            data = os.read(fd, _BULK_READ_CHUNK)
+            if not data:
+                break
+            parts.append(data)
+    finally:
+        os.close(fd)
+    data = parts[0] if len(parts) == 1 else b"".join(parts)
+    if b"\r" in data:
+        # universal newlines, as text-mode open() gave: the field regexes anchor on '\n'
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.decode("utf-8", "replace"), mtime
+
+
+def _bulk_scan_fields(text: str) -> Tuple[str, List[str], Optional[str]]:
+    """
+    (title, serials, crc) as parse_pnach_text would report them, from a single
+    _BULK_FIELDS_RE pass; the Bulk tab has no use for the patch/comment parse.
+    """
+    title = None
+    crc = None
+    serials = set()
+    for m in _BULK_FIELDS_RE.finditer(text):
+        s = m.group("serial")
+        if s is not None:
+            serials.add(s.upper().replace("_", "-"))
+            continue
+        c = m.group("crc")
+        if c is not None:
+            if crc is None:
+                crc = normalize_crc(c)
+            continue
+        line = m.group("title")
+        if title is None:
+            title = line.strip()
+        # the title match consumed the whole line; pick up anything else written on it
+        serials.update(x.group(0).upper().replace("_", "-") for x in SERIAL_RE.finditer(line))
+        if crc is None:
+            mc = CRC_IN_TEXT.search(line)
+            if mc:
+                crc = normalize_crc(mc.group(1))
+    return title or "", sorted(serials), crc
+
+
+def _bulk_parse_text(p: str, text: str) -> Dict[str, str]:
+    """Parse the text of one Bulk tab file into a result row."""
+    try:
+        title, serials, crc = _bulk_scan_fields(text)
+        if not crc:
+            # only reached when the text had no CRC; match the name as bytes (ASCII-only pattern)
+            m = _FNAME_CRC_RE_BYTES.search(os.fsencode(_basename(p)))
+            if m: crc = normalize_crc(m.group(1).decode("ascii"))
+        return {
+            "file": p,
+            "serials": "; ".join(serials),
+            "crc": crc or "",
+            "title": title,
+            "status": "parsed"
+        }
+    except Exception as e:
+        return {"file": p, "serials": "", "crc": "", "title": "", "status": f"error: {e}"}
+
+
 class BulkScanWorker(QThread):
     progressed = Signal(int, int)  # current, total
     scanned = Signal(int, dict)    # row index, result dict (backwards compat)
     scanned_batch = Signal(list)   # list of (row index, result dict)
     finished = Signal()
 
+    # scanned_batch is flushed when this many rows are pending or BATCH_INTERVAL seconds have passed
+    BATCH_MAX = 200
+    BATCH_INTERVAL = 0.075
+    # texts of files up to this size are kept (at most TEXT_CACHE_MAX_FILES of them) for BulkTab's cache
+    TEXT_CACHE_MAX_BYTES = 256 * 1024
+    TEXT_CACHE_MAX_FILES = 512
+
     def __init__(self, paths, parent=None):
         super().__init__(parent)
         self.paths = paths
-        # tune worker threads (IO+CPU mixed); cap for responsiveness
+        # tune reader threads (IO-bound); cap for responsiveness
         self.max_workers = min(8, (os.cpu_count() or 4))
+        # path -> (mtime_ns, text) for the files read by this scan
+        self.texts: Dict[str, Tuple[int, str]] = {}
 
     def run(self):
         total = len(self.paths)
         results = [None] * total
 
+        texts = self.texts
+        text_max = self.TEXT_CACHE_MAX_BYTES
+        texts_max = self.TEXT_CACHE_MAX_FILES
+
+        # Parsing is a single regex pass per file, cheaper than shipping the text to another
+        # process, so it stays on the reader threads.
         def process(i, p):
-            res = {"file": p, "serials": "", "crc": "", "title": "", "status": ""}
             try:
-                with open(p, "r", encoding="utf-8", errors="replace") as f:
-                    text = f.read()
-                pd = parse_pnach_text(text)
-                serials = pd.serials[:]
-                crc = pd.crc
-                title = pd.title or ""
-                if not serials:
-                    serials = parse_serials(text)
-                if not crc:
-                    m = re.search(r"([0-9A-Fa-f]{8})", os.path.basename(p))
-                    if m: crc = normalize_crc(m.group(1))
-                res = {
-                    "file": p,
-                    "serials": "; ".join(serials),
-                    "crc": crc or "",
-                    "title": title,
-                    "status": "parsed"
-                }
+                text, mtime = _bulk_read_text(p)
             except Exception as e:
-                res = {"file": p, "serials": "", "crc": "", "title": "", "status": f"error: {e}"}
-            return (i, res)
+                return i, {"file": p, "serials": "", "crc": "", "title": "", "status": f"error: {e}"}
+            if len(text) <= text_max and len(texts) < texts_max:
+                texts[p] = (mtime, text)
+            return i, _bulk_parse_text(p, text)
 
-        # Use a thread pool to parallelize file parsing and reduce wall time on many files
         batch = []
-        batch_size = 20
         processed = 0
+        last_flush = time.monotonic()
+        # the per-row signal is only kept for old listeners; skip it when nobody is connected
+        emit_rows = self.receivers(SIGNAL("scanned(int,QVariantMap)")) > 0
+        # hot per-completion lookups bound once
+        emit_progress = self.progressed.emit
+        emit_batch = self.scanned_batch.emit
+        emit_row = self.scanned.emit
+        store = results.__setitem__
+        append = batch.append
+        monotonic = time.monotonic
+        batch_max = self.BATCH_MAX
+        batch_interval = self.BATCH_INTERVAL
+
+        def flush():
+            nonlocal last_flush
+            emit_batch(batch[:])
+            if emit_rows:
+                for ii, rr in batch:
+                    emit_row(ii, rr)
+            batch.clear()
+            last_flush = monotonic()
+
+        def deliver(idx, res):
+            nonlocal processed
+            store(idx, res)
+            append((idx, res))
+            processed += 1
+            # emit progress as processed/total
+            emit_progress(processed, total)
+            # flush on size, or on a short time tick so slow scans still update the table
+            if len(batch) >= batch_max or monotonic() - last_flush >= batch_interval:
+                flush()
+
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-            futures = {ex.submit(process, idx, path): idx for idx, path in enumerate(self.paths)}
+            futures = [ex.submit(process, idx, path) for idx, path in enumerate(self.paths)]
             for fut in concurrent.futures.as_completed(futures):
-                idx, res = fut.result()
-                results[idx] = res
-                batch.append((idx, res))
-                processed += 1
-                # emit progress as processed/total
-                try:
-                    self.progressed.emit(processed, total)
-                except Exception:
-                    pass
-                if len(batch) >= batch_size:
-                    try:
-                        self.scanned_batch.emit(batch[:])
-                    except Exception:
-                        pass
-                    # for backwards compat, also emit individual scanned signals
-                    for ii, rr in batch:
-                        try:
-                            self.scanned.emit(ii, rr)
-                        except Exception:
-                            pass
-                    batch.clear()
+                deliver(*fut.result())
         # flush remaining
         if batch:
-            try:
-                self.scanned_batch.emit(batch[:])
-            except Exception:
-                pass
-            for ii, rr in batch:
-                try:
-                    self.scanned.emit(ii, rr)
-                except Exception:
-                    pass
-            batch.clear()
+            flush()
         # final progress ensure
-        try:
-            self.progressed.emit(total, total)
-        except Exception:
-            pass
+        emit_progress(total, total)
         self.finished.emit()
 
 
+class BulkTableModel(QAbstractTableModel):
+    """
+    Table model for the Bulk tab, stored column-wise: one plain list of strings per
+    column (File, Serial(s), CRC, Title, Status) instead of one item object per cell.
+    """
+    HEADERS = ["File", "Serial(s)", "CRC", "Title", "Status"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cols: List[List[str]] = [[] for _ in self.HEADERS]
+        # lowercased search haystacks, kept in step with _cols: per column, and all columns joined
+        self._hay_cols: List[List[str]] = [[] for _ in self.HEADERS]
+        self._hay_all: List[str] = []
+        # resolve lookup keys per row, computed when a row is set rather than on every Resolve:
+        # upper-cased CRC, and (serial, norm_serial_key(serial)) pairs
+        self._crc_keys: List[str] = []
+        self._serial_keys: List[Tuple[Tuple[str, str], ...]] = []
+
+    # ---------- Qt model API ----------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cols[0])
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._cols[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        n = self.rowCount()
+        if n < 2:
+            return
+        self.layoutAboutToBeChanged.emit()
+        key_col = self._cols[column]
+        new_order = sorted(range(n), key=key_col.__getitem__, reverse=(order == Qt.DescendingOrder))
+        self._cols = [[col[i] for i in new_order] for col in self._cols]
+        self._hay_cols = [[col[i] for i in new_order] for col in self._hay_cols]
+        self._hay_all = [self._hay_all[i] for i in new_order]
+        self._crc_keys = [self._crc_keys[i] for i in new_order]
+        self._serial_keys = [self._serial_keys[i] for i in new_order]
+        # keep selection/current index attached to the same data rows
+        new_pos = [0] * n
+        for new_r, old_r in enumerate(new_order):
+            new_pos[old_r] = new_r
+        old_idx = self.persistentIndexList()
+        self.changePersistentIndexList(old_idx, [self.index(new_pos[i.row()], i.column()) for i in old_idx])
+        self.layoutChanged.emit()
+
+    # ---------- Bulk tab helpers ----------
+    def column(self, c: int) -> List[str]:
+        return self._cols[c]
+
+    def row(self, r: int) -> List[str]:
+        return [col[r] for col in self._cols]
+
+    def value(self, r: int, c: int) -> str:
+        return self._cols[c][r]
+
+    def haystacks(self, c: Optional[int] = None) -> List[str]:
+        """Lowercased search text per row for column ``c``, or for all columns joined when None."""
+        return self._hay_all if c is None else self._hay_cols[c]
+
+    def lookup_keys(self, r: int) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """(CRC key, ((serial, normalized serial), ...)) for row r."""
+        return self._crc_keys[r], self._serial_keys[r]
+
+    def _update_haystacks(self, r: int):
+        vals = [col[r] for col in self._cols]
+        for hay, val in zip(self._hay_cols, vals):
+            hay[r] = val.lower()
+        self._hay_all[r] = " | ".join(vals).lower()
+        self._crc_keys[r] = vals[2].strip().upper()
+        self._serial_keys[r] = tuple((x, norm_serial_key(x)) for x in (y.strip() for y in vals[1].split(";")) if x)
+
+    def append_files(self, files: List[str]):
+        n = len(files)
+        if not n:
+            return
+        start = self.rowCount()
+        self.beginInsertRows(QModelIndex(), start, start + n - 1)
+        self._cols[0].extend(files)
+        for col in self._cols[1:4]:
+            col.extend([""] * n)
+        self._cols[4].extend(["queued"] * n)
+        for hay, col in zip(self._hay_cols, self._cols):
+            hay.extend(v.lower() for v in col[start:])
+        self._hay_all.extend(" | ".join(vals).lower() for vals in zip(*(col[start:] for col in self._cols)))
+        self._crc_keys.extend([""] * n)
+        self._serial_keys.extend([()] * n)
+        self.endInsertRows()
+
+    def set_row(self, r: int, values: List[str]):
+        for col, val in zip(self._cols, values):
+            col[r] = val
+        self._update_haystacks(r)
+        self.dataChanged.emit(self.index(r, 0), self.index(r, len(self.HEADERS) - 1))
+
+    def clear_details(self):
+        """Blank every column except File (used before a re-scan)."""
+        n = self.rowCount()
+        if not n:
+            return
+        for c in range(1, len(self.HEADERS)):
+            self._cols[c] = [""] * n
+            self._hay_cols[c] = [""] * n
+        self._hay_all = [f.lower() + " |  |  |  | " for f in self._cols[0]]
+        self._crc_keys = [""] * n
+        self._serial_keys = [()] * n
+        self.dataChanged.emit(self.index(0, 1), self.index(n - 1, len(self.HEADERS) - 1))
+
+    def clear(self):
+        self.beginResetModel()
+        self._cols = [[] for _ in self.HEADERS]
+        self._hay_cols = [[] for _ in self.HEADERS]
+        self._hay_all = []
+        self._crc_keys = []
+        self._serial_keys = []
+        self.endResetModel()
+
+
 class BulkTab(QWidget):
     """
     Bulk scan a set of files/folders and list:
@@ -5145,6 +5374,12 @@ class BulkTab(QWidget):
     - Load in Cheats (double-click row or button)
     """
     ALLOWED_EXTS = (".pnach", ".txt", ".ini", ".cb", ".cbc", ".rtxt")
+    # anchored at the end and case-insensitive, so checking a name never lowercases the whole path
+    ALLOWED_RE = re.compile(r"\.(?:" + "|".join(re.escape(e.lstrip(".")) for e in ALLOWED_EXTS) + r")\Z", re.IGNORECASE)
+    # rows filtered per event-loop turn; larger tables are filtered across several turns
+    FILTER_CHUNK = 2000
+    # scanned file texts kept for Load in Cheats (LRU)
+    TEXT_CACHE_MAX_FILES = 512
 
     def __init__(self, parent: 'MainWindow'):
         super().__init__()
@@ -5152,6 +5387,11 @@ class BulkTab(QWidget):
         self._shutting_down = False  # Flag to prevent new workers during shutdown
         self.paths: List[str] = []
         self.rows: List[Dict[str, str]] = []  # {"file","serials","crc","title","status"}
+        # incremental filter state; _filter_gen invalidates a pass that a newer filter replaced
+        self._filter_gen = 0
+        self._filter_state: Optional[dict] = None
+        # path -> (mtime_ns, text), most recently used last
+        self.text_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
         self._build_ui()
 
     # ---------- UI ----------
@@ -5254,9 +5494,12 @@ class BulkTab(QWidget):
         self.progress.setValue(0)
         layout.addWidget(self.progress)
 
-        # Table
-        self.table = QTableWidget(0, 5, self)
-        self.table.setHorizontalHeaderLabels(["File", "Serial(s)", "CRC", "Title", "Status"])
+        # Table (view over a column-wise model; no per-cell item objects)
+        self.model = BulkTableModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        # hidden rows are tracked by position, so re-filter after a header-click sort
+        self.model.layoutChanged.connect(self._reapply_filter_after_data_change)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.doubleClicked.connect(self._load_selected_into_cheats)
@@ -5333,24 +5576,40 @@ class BulkTab(QWidget):
     def _add_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Add folder", os.path.expanduser("~"))
         if not folder: return
-        if self.chk_recurse.isChecked():
-            for root, _, files in os.walk(folder):
-                for name in files:
-                    p = os.path.join(root, name)
-                    if self._allowed(p): self.paths.append(p)
-        else:
-            for name in os.listdir(folder):
-                p = os.path.join(folder, name)
-                if os.path.isfile(p) and self._allowed(p): self.paths.append(p)
+        self.paths.extend(self._iter_allowed_files(folder, self.chk_recurse.isChecked()))
         self._refresh_table_rows(new_only=True)
 
+    def _iter_allowed_files(self, folder: str, recurse: bool):
+        """Yield cheat/code files under folder; scandir entries carry their type, so no extra stat per name."""
+        allowed = self.ALLOWED_RE.search
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        # files of a folder before its subfolders, the same order os.walk gave
+        for e in entries:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    if recurse:
+                        subdirs.append(e.path)
+                    continue
+                if allowed(e.name) and e.is_file():
+                    yield e.path
+            except OSError:
+                continue
+        for sub in subdirs:
+            yield from self._iter_allowed_files(sub, recurse)
+
     def _allowed(self, path: str) -> bool:
-        return path.lower().endswith(self.ALLOWED_EXTS)
+        return self.ALLOWED_RE.search(path) is not None
 
     def _clear_all(self):
         self.paths.clear()
         self.rows.clear()
-        self.table.setRowCount(0)
+        self.model.clear()
+        self.text_cache.clear()
         self.progress.setMaximum(1)
         self.progress.setValue(0)
 
@@ -5359,25 +5618,16 @@ class BulkTab(QWidget):
         existing_files = set(self._iter_column_values(0))
         to_add = [p for p in self.paths if (p not in existing_files or not new_only)]
         self.table.setSortingEnabled(False)
-        for p in to_add:
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            for c, val in enumerate([p, "", "", "", "queued"]):
-                self.table.setItem(r, c, QTableWidgetItem(val))
+        # one beginInsertRows/endInsertRows for the whole batch
+        self.model.append_files(to_add)
         self.table.setSortingEnabled(True)
         self._reapply_filter_after_data_change()
 
     def _iter_column_values(self, col: int):
-        for r in range(self.table.rowCount()):
-            it = self.table.item(r, col)
-            yield it.text() if it else ""
+        yield from self.model.column(col)
 
     def _set_row(self, r: int, file: str, serials: str, crc: str, title: str, status: str):
-        self.table.setItem(r, 0, QTableWidgetItem(file))
-        self.table.setItem(r, 1, QTableWidgetItem(serials))
-        self.table.setItem(r, 2, QTableWidgetItem(crc))
-        self.table.setItem(r, 3, QTableWidgetItem(title))
-        self.table.setItem(r, 4, QTableWidgetItem(status))
+        self.model.set_row(r, [file, serials, crc, title, status])
 
     # ---------- Filtering ----------
     def _apply_filter(self):
@@ -5386,43 +5636,66 @@ class BulkTab(QWidget):
         use_regex = self.chk_regex.isChecked()
         scope = self.search_in.currentText()  # "All columns" or specific
 
-        # Pre-compile regex or escape text
+        # Haystacks are already lowercased: a literal query is a plain substring test on the
+        # lowercased text; only regex mode compiles a pattern (keeping IGNORECASE, since
+        # lowercasing a user regex would change escapes like \D or \S).
+        self._filter_gen += 1
+        self._filter_state = None
         pattern = None
-        if text:
+        needle = None
+        if text and not use_regex:
+            needle = text.lower()
+        elif text:
             try:
-                if use_regex:
-                    pattern = re.compile(text, re.IGNORECASE)
-                else:
-                    pattern = re.compile(re.escape(text), re.IGNORECASE)
+                pattern = re.compile(text, re.IGNORECASE)
             except re.error:
                 # invalid regex: show nothing and mark progress bar to hint
-                for r in range(self.table.rowCount()):
+                for r in range(self.model.rowCount()):
                     self.table.setRowHidden(r, True)
                 self.progress.setFormat("Invalid regex")
                 return
 
+        self._filter_state = {
+            "gen": self._filter_gen,
+            "hay": self.model.haystacks(None if scope == "All columns" else BulkTableModel.HEADERS.index(scope)),
+            "needle": needle,
+            "search": pattern.search if pattern else None,
+            "cursor": 0,
+            "shown": 0,
+        }
+        # first chunk runs now; the rest (if any) is scheduled so the UI repaints in between
+        self._filter_step()
+
+    def _filter_step(self):
+        st = self._filter_state
+        if st is None or st["gen"] != self._filter_gen:
+            return  # superseded by a newer filter
+        hay_list = st["hay"]
+        needle = st["needle"]
+        search = st["search"]
+        set_hidden = self.table.setRowHidden
+        start = st["cursor"]
+        end = min(start + self.FILTER_CHUNK, len(hay_list))
         shown = 0
-        for r in range(self.table.rowCount()):
-            # Gather text per row
-            cols = [
-                self.table.item(r, c).text() if self.table.item(r, c) else ""
-                for c in range(self.table.columnCount())
-            ]
-            if not pattern:
-                keep = True  # empty query -> show all
+        for r in range(start, end):
+            hay = hay_list[r]
+            if needle is not None:
+                keep = needle in hay
+            elif search is not None:
+                keep = search(hay) is not None
             else:
-                if scope == "All columns":
-                    hay = " | ".join(cols)
-                    keep = bool(pattern.search(hay))
-                else:
-                    idx = ["File","Serial(s)","CRC","Title","Status"].index(scope)
-                    hay = cols[idx]
-                    keep = bool(pattern.search(hay))
-            self.table.setRowHidden(r, not keep)
+                keep = True  # empty query -> show all
+            set_hidden(r, not keep)
             if keep:
                 shown += 1
+        st["shown"] += shown
+        st["cursor"] = end
+        if end < len(hay_list):
+            QTimer.singleShot(0, self._filter_step)
+            return
 
-        self.progress.setFormat(f"Showing {shown}/{self.table.rowCount()}")
+        self._filter_state = None
+        self.progress.setFormat(f"Showing {st['shown']}/{self.model.rowCount()}")
         # keep progress bar visible but not 'busy'
         if self.progress.maximum() <= 1:
                 self.progress.setMaximum(1)
@@ -5451,14 +5724,12 @@ class BulkTab(QWidget):
         # Don't start new scans if shutting down
         if getattr(self, '_shutting_down', False):
             return
-        paths = [self.table.item(r, 0).text() for r in range(self.table.rowCount())]
+        paths = list(self.model.column(0))
         self.progress.setMaximum(max(1, len(paths)))
         self.progress.setValue(0)
         self._disable_ui(True)
         self.table.setSortingEnabled(False)
-        for r in range(self.table.rowCount()):
-            for c in range(1, 5):
-                self.table.setItem(r, c, QTableWidgetItem(""))
+        self.model.clear_details()
         self.worker = BulkScanWorker(paths)
         # connect progress → percent formatter
         self.worker.progressed.connect(self._set_progress)
@@ -5469,10 +5740,6 @@ class BulkTab(QWidget):
             for idx, result in sorted(batch, key=lambda x: x[0]):
                 self._set_row(idx, result["file"], result["serials"], result["crc"], result["title"], result["status"])
         self.worker.scanned_batch.connect(on_scanned_batch)
-        # Backward compat single-item signal
-        def on_scanned(idx, result):
-            self._set_row(idx, result["file"], result["serials"], result["crc"], result["title"], result["status"])
-        self.worker.scanned.connect(on_scanned)
         def on_finished():
             # final label and reset
             self.progress.setMaximum(1)
@@ -5481,6 +5748,8 @@ class BulkTab(QWidget):
             self._disable_ui(False)
             self.table.setSortingEnabled(True)
             self._reapply_filter_after_data_change()
+            for p, entry in self.worker.texts.items():
+                self._cache_text(p, entry)
         self.worker.finished.connect(on_finished)
         self.worker.start()
 
@@ -5500,29 +5769,31 @@ class BulkTab(QWidget):
 
     # ---------- Resolve Titles (batch) ----------
     def _resolve_titles(self):
-        # Collect keys for unresolved rows
+        # Collect keys for unresolved rows (deduplicated as we go, order preserved)
         keys = []
-        for r in range(self.table.rowCount()):
-            title = self.table.item(r, 3).text().strip() if self.table.item(r,3) else ""
+        seen = set()
+        files, serial_col, crc_col, title_col = (self.model.column(c) for c in range(4))
+        for r in range(self.model.rowCount()):
+            title = title_col[r].strip()
             if title: continue
-            crc = self.table.item(r, 2).text().strip()
-            serials = (self.table.item(r, 1).text() or "").split(";")
+            crc = crc_col[r].strip()
+            serials = serial_col[r].split(";")
             # Try to extract from filename if missing
             if not crc or not any(serials):
-                file_path = self.table.item(r, 0).text() if self.table.item(r,0) else ""
-                fname = os.path.basename(file_path)
+                file_path = files[r]
+                fname = _basename(file_path)
                 # CRC: look for 8 hex digits
-                m_crc = re.search(r"([0-9A-Fa-f]{8})", fname)
+                m_crc = _FNAME_CRC_RE.search(fname)
                 if m_crc and not crc:
                     crc = m_crc.group(1).upper()
                 # Serial: look for common serial pattern
-                m_serial = re.search(r"([A-Z]{4,5}[-_ ]?\d{3,5})", fname, re.IGNORECASE)
+                m_serial = _FNAME_SERIAL_RE.search(fname)
                 if m_serial and not any(serials):
                     serials = [m_serial.group(1).replace("_", "-").upper()]
-            if crc:
-                keys.append(crc)
-            for s in [x.strip() for x in serials if x.strip()]:
-                keys.append(s)
+            for k in [crc] + [x.strip() for x in serials]:
+                if k and k not in seen:
+                    seen.add(k)
+                    keys.append(k)
         # Nothing to do?
         if not keys:
             QMessageBox.information(self, "Resolve Titles", "Nothing to resolve: no serials or CRCs found to look up. (Did you scan files first?)")
@@ -5530,7 +5801,7 @@ class BulkTab(QWidget):
 
         # Kick a single ResolveWorker for the whole batch
         worker = ResolveWorker(
-            keys=list(dict.fromkeys(keys)),  # unique preserve order
+            keys=keys,
             local_map=getattr(self.parent.cheats_tab, "mapping", {}) or {},
             use_bundled_lists=self.chk_offline_lists.isChecked(),
             try_online=self.chk_online.isChecked() and (requests is not None)
@@ -5542,22 +5813,22 @@ class BulkTab(QWidget):
 
         def on_done(out: Dict[str,str]):
             # Update each row’s title/CRC if available
-            for r in range(self.table.rowCount()):
-                file = self.table.item(r,0).text()
-                serials = [x.strip() for x in (self.table.item(r,1).text() or "").split(";") if x.strip()]
-                crc = (self.table.item(r,2).text() or "").strip()
-                title = (self.table.item(r,3).text() or "").strip()
+            model = self.model
+            files, title_col = model.column(0), model.column(3)
+            for r in range(model.rowCount()):
+                crc, serial_keys = model.lookup_keys(r)
+                serials = [s for s, _n in serial_keys]
+                title = title_col[r].strip()
 
                 # Prefer CRC title, else any serial title
                 picked_title = title
                 if not picked_title and crc and crc in out:
                     picked_title = out[crc]
                 if not picked_title:
-                    for s in serials:
+                    for s, n in serial_keys:
                         if s in out:
                             picked_title = out[s]
                             break
-                        n = norm_serial_key(s)
                         if n in out:
                             picked_title = out[n]
                             break
@@ -5574,7 +5845,7 @@ class BulkTab(QWidget):
 
                 # Only mark as resolved if Title, CRC, and at least one Serial are present
                 if picked_title and crc and serials and any(serials):
-                    self._set_row(r, file, "; ".join(serials), crc, picked_title, "resolved")
+                    self._set_row(r, files[r], "; ".join(serials), crc, picked_title, "resolved")
                 # Otherwise, keep as-is (could optionally set a different status)
             # small UX touch
             self.progress.setMaximum(1)
@@ -5587,13 +5858,10 @@ class BulkTab(QWidget):
 
     # ---------- Copy / Export ----------
     def _gather_rows(self, only_selected=False) -> List[List[str]]:
-        rows = []
-        indices = self.table.selectionModel().selectedRows() if only_selected else [self.table.model().index(r,0) for r in range(self.table.rowCount())]
-        for idx in indices:
-            r = idx.row()
-            vals = [self.table.item(r,c).text() if self.table.item(r,c) else "" for c in range(5)]
-            rows.append(vals)
-        return rows
+        if not only_selected:
+            return [list(vals) for vals in zip(*(self.model.column(c) for c in range(len(BulkTableModel.HEADERS))))]
+        row = self.model.row
+        return [row(r) for r in sorted({idx.row() for idx in self.table.selectionModel().selectedRows()})]
 
     def _copy_selected(self):
         self._copy_rows(True)
@@ -5602,26 +5870,49 @@ class BulkTab(QWidget):
         self._copy_rows(False)
 
     def _copy_rows(self, only_selected: bool):
-        rows = self._gather_rows(only_selected)
-        lines = ["\t".join(["File","Serial(s)","CRC","Title","Status"])]
-        for vals in rows:
-            lines.append("\t".join(vals))
-        text = "\n".join(lines)
-        QApplication.clipboard().setText(text)
+        import io
+        buf = io.StringIO()
+        write = buf.write
+        write("\t".join(BulkTableModel.HEADERS))
+        for vals in self._gather_rows(only_selected):
+            write("\n")
+            write("\t".join(vals))
+        QApplication.clipboard().setText(buf.getvalue())
         QMessageBox.information(self, "Copied", f"Copied {'selected' if only_selected else 'all'} rows to clipboard.")
 
     def _export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export CSV", os.path.expanduser("~"), "CSV (*.csv)")
         if not path: return
         import csv
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f)
-            w.writerow(["File","Serial(s)","CRC","Title","Status"])
-            for vals in self._gather_rows(False):
-                w.writerow(vals)
+            w.writerow(BulkTableModel.HEADERS)
+            w.writerows(self._gather_rows(False))
         QMessageBox.information(self, "Export", f"Saved: {path}")
 
     # ---------- Hand-off to Cheats ----------
+    def _cache_text(self, path: str, entry: Tuple[int, str]):
+        cache = self.text_cache
+        cache[path] = entry
+        cache.move_to_end(path)
+        while len(cache) > self.TEXT_CACHE_MAX_FILES:
+            cache.popitem(last=False)
+
+    def _cached_text(self, path: str) -> Optional[str]:
+        """Cached text of path if the file has not changed since it was read, else None."""
+        entry = self.text_cache.get(path)
+        if entry is None:
+            return None
+        try:
+            fresh = os.stat(path).st_mtime_ns == entry[0]
+        except OSError:
+            fresh = False
+        if not fresh:
+            self.text_cache.pop(path, None)
+            return None
+        self.text_cache.move_to_end(path)
+        return entry[1]
+
     def _load_selected_into_cheats(self):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
@@ -5629,22 +5920,24 @@ class BulkTab(QWidget):
             return
         # Load the first selected row
         r = sel[0].row()
-        path = self.table.item(r,0).text()
-        serials = [x.strip() for x in (self.table.item(r,1).text() or "").split(";") if x.strip()]
-        crc = (self.table.item(r,2).text() or "").strip()
-        title = (self.table.item(r,3).text() or "").strip()
-        try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                text = f.read()
-        except Exception as e:
-            QMessageBox.warning(self, "Open failed", str(e))
-            return
+        path, serials, crc, title, _status = self.model.row(r)
+        serials = [x.strip() for x in serials.split(";") if x.strip()]
+        crc = crc.strip()
+        title = title.strip()
+        text = self._cached_text(path)
+        if text is None:
+            try:
+                text, mtime = _bulk_read_text(path)
+            except Exception as e:
+                QMessageBox.warning(self, "Open failed", str(e))
+                return
+            self._cache_text(path, (mtime, text))
 
         cheats = self.parent.cheats_tab
         # Fill editor with content
         cheats.codes_text.setPlainText(text)
         # Prefer CRC from filename too
-        m = re.search(r"([0-9A-Fa-f]{8})", os.path.basename(path))
+        m = _FNAME_CRC_RE.search(_basename(path))
         prefer_crc = m.group(1) if m else None
 
         # If we already have fields from the table, set them first (then let autofill backfill missing bits)
@@ -5787,6 +6080,8 @@ class SettingsTab(QWidget):
         
         self.profiles_list = QListWidget()
         self.profiles: Dict[str, Dict] = {}
+        # profile keys in list-row order, rebuilt by _refresh_profiles
+        self._profile_keys: List[str] = []
         self.profiles_list.itemSelectionChanged.connect(self._load_selected_profile)
         pfl.addWidget(self.profiles_list)
         
@@ -5841,20 +6136,37 @@ class SettingsTab(QWidget):
 
     # INI toggles (best-effort; may vary by version)
     def _ini_set_bool(self, ini_path: str, key: str, val: bool):
+        # Streamed into a temp file that replaces the INI atomically, so a crash mid-write can't
+        # leave PCSX2.ini truncated. newline='' keeps the file's own line endings.
+        tmp = ini_path + '.tmp'
         try:
             if not os.path.isfile(ini_path): return False
-            with open(ini_path, 'r', encoding='utf-8', errors='replace') as f: lines = f.readlines()
+            setting = f"{key}={'enabled' if val else 'disabled'}"
+            prefix = key.lower() + "="
             found = False
-            for i, line in enumerate(lines):
-                if line.strip().lower().startswith(key.lower()+"="):
-                    lines[i] = f"{key}={'enabled' if val else 'disabled'}\n"
-                    found = True
-                    break
-            if not found:
-                lines.append(f"{key}={'enabled' if val else 'disabled'}\n")
-            with open(ini_path, 'w', encoding='utf-8') as f: f.writelines(lines)
+            last = ''
+            with open(ini_path, 'r', encoding='utf-8', errors='replace', newline='') as src, \
+                    open(tmp, 'w', encoding='utf-8', newline='', buffering=1 << 16) as dst:
+                for line in src:
+                    if not found and line.strip().lower().startswith(prefix):
+                        line = setting + line[len(line.rstrip('\r\n')):]
+                        found = True
+                    dst.write(line)
+                    last = line
+                if not found:
+                    eol = '\r\n' if last.endswith('\r\n') else '\n'
+                    if last and not last.endswith(('\n', '\r')):
+                        dst.write(eol)
+                    dst.write(setting + eol)
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp, ini_path)
             return True
         except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
             return False
 
     def _toggle_cheats_ini(self):
@@ -5891,7 +6203,9 @@ class SettingsTab(QWidget):
 
     def _refresh_profiles(self):
         self.profiles_list.clear()
-        for k, v in sorted(self.profiles.items()):
+        self._profile_keys = sorted(self.profiles)
+        for k in self._profile_keys:
+            v = self.profiles[k]
             t = v.get('title') or ''
             s = v.get('serial') or ''
             c = v.get('crc') or ''
@@ -5899,8 +6213,8 @@ class SettingsTab(QWidget):
 
     def _load_selected_profile(self):
         idx = self.profiles_list.currentRow()
-        if idx < 0: return
-        key = list(sorted(self.profiles.keys()))[ idx ]
+        if not 0 <= idx < len(self._profile_keys): return
+        key = self._profile_keys[idx]
         v = self.profiles[key]
         self.profile_title.setText(v.get('title',''))
         self.profile_serial.setText(v.get('serial',''))
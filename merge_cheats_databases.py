@@ -7,9 +7,22 @@ Combines local cheats, GitHub cheats, and existing database into comprehensive c
 import os
 import json
 import logging
-from typing import Dict, List
+import shutil
+import stat
+import statistics
+import tempfile
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 from datetime import datetime
 
+from _fastjson import dump
+
+try:
+    import ijson  # optional: streams the games list instead of loading the whole file
+except ImportError:
+    ijson = None
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -23,15 +36,28 @@ class CheatsDatabase:
         return title.lower().strip()
     
     @staticmethod
-    def load_database(filepath: str) -> Dict:
-        """Load JSON database."""
+    def iter_games(filepath: str) -> Iterator[Dict]:
+        """
+        Yield the game dicts of a JSON database one at a time.
+        Streams with ijson when it is installed; otherwise falls back to json.load.
+        A parse error is raised after the games before it were yielded, so callers
+        that must not use a truncated database should go through load_database.
+        """
         if not os.path.exists(filepath):
             logger.warning(f"Database not found: {filepath}")
-            return {'games': []}
+            return
         
+        with open(filepath, 'rb', buffering=1 << 20) as f:
+            if ijson is not None:
+                yield from ijson.items(f, 'games.item', use_float=True)
+            else:
+                yield from json.load(f).get('games', [])
+    
+    @staticmethod
+    def load_database(filepath: str) -> Dict:
+        """Load JSON database (all or nothing: an unreadable file gives no games)."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return {'games': list(CheatsDatabase.iter_games(filepath))}
         except Exception as e:
             logger.error(f"Error loading {filepath}: {e}")
             return {'games': []}
@@ -41,104 +67,183 @@ class CheatsDatabase:
         """Save JSON database."""
         os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(database, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            dump(database, f)
         
         logger.info(f"Database saved: {filepath}")
     
     @staticmethod
-    def merge_databases(databases: List[Dict], prefer_larger: bool = True) -> Dict:
+    def merge_databases(databases: List[Union[Dict, Iterable[Dict]]], prefer_larger: bool = True) -> Dict:
         """
         Merge multiple databases into one comprehensive database.
         
         Args:
-            databases: List of database dicts to merge
+            databases: List of database dicts, or iterables of game dicts (e.g. iter_games), to merge
             prefer_larger: If True, prefer entries with more cheats
         """
+        return CheatsDatabase.merge_databases_with_stats(databases, prefer_larger)[0]
+    
+    @staticmethod
+    def merge_databases_with_stats(databases: List[Union[Dict, Iterable[Dict]]],
+                                   prefer_larger: bool = True) -> Tuple[Dict, Dict]:
+        """
+        Same as merge_databases, but also return the merged database's statistics
+        (as get_statistics reports them), gathered while the games list is rebuilt.
+        """
+        # Database dicts without games contribute nothing; streamed inputs can't be checked up front
+        databases = [db for db in databases if not isinstance(db, dict) or db.get('games')]
+        
         merged = {'games': []}
-        game_lookup = {}  # Key: normalized (game_title, serial, crc)
+        # Flat per-region arrays; index_map gives a region's slot for
+        # "normalized title\x1fserial\x1fcrc\x1fregion" with a single dict probe
+        # (one string hash instead of hashing a tuple of four strings).
+        index_map = {}
+        game_of = []  # slot -> index into game_titles
+        region_names = []
+        serials = []
+        crcs = []
+        cheat_lists = []
+        game_index = {}  # "normalized title\x1fserial\x1fcrc" -> index into game_titles
+        game_titles = []
+        # The same titles/serials/CRCs recur across the input databases: normalize each distinct string once
+        norm_titles = {}
+        upper = {'': '', None: ''}
         
-        for db_idx, db in enumerate(databases):
-            for game in db.get('games', []):
+        for db in databases:
+            games = db.get('games', []) if isinstance(db, dict) else db
+            for game in games:
                 game_title = game.get('title', 'Unknown')
-                norm_title = CheatsDatabase.normalize_game_title(game_title)
+                norm_title = norm_titles.get(game_title)
+                if norm_title is None:
+                    norm_title = norm_titles[game_title] = CheatsDatabase.normalize_game_title(game_title)
                 
                 for region, region_data in game.get('regions', {}).items():
                     serial = region_data.get('serial', '')
                     crc = region_data.get('crc', '')
                     cheats = region_data.get('cheats', [])
+                    serial_u = upper.get(serial)
+                    if serial_u is None:
+                        serial_u = upper[serial] = serial.upper()
+                    crc_u = upper.get(crc)
+                    if crc_u is None:
+                        crc_u = upper[crc] = crc.upper()
                     
-                    # Create lookup key
-                    key = (norm_title, serial.upper() if serial else '', crc.upper() if crc else '')
-                    
-                    if key not in game_lookup:
+                    game_key = f"{norm_title}\x1f{serial_u}\x1f{crc_u}"
+                    key = f"{game_key}\x1f{region}"
+                    idx = index_map.get(key)
+                    if idx is None:
                         # New entry
-                        game_lookup[key] = {
-                            'title': game_title,
-                            'regions': {}
-                        }
+                        gi = game_index.get(game_key)
+                        if gi is None:
+                            gi = game_index[game_key] = len(game_titles)
+                            game_titles.append(game_title)
+                        index_map[key] = len(game_of)
+                        game_of.append(gi)
+                        region_names.append(region)
+                        serials.append(serial)
+                        crcs.append(crc)
+                        cheat_lists.append(cheats)
+                        continue
                     
-                    # Merge region data
-                    if region not in game_lookup[key]['regions']:
-                        game_lookup[key]['regions'][region] = {
-                            'serial': serial,
-                            'crc': crc,
-                            'cheats': cheats
-                        }
-                    else:
-                        # Decide whether to replace
-                        existing_cheats = game_lookup[key]['regions'][region].get('cheats', [])
-                        new_cheats = cheats
-                        
-                        if prefer_larger and len(new_cheats) > len(existing_cheats):
-                            game_lookup[key]['regions'][region]['cheats'] = new_cheats
-                            game_lookup[key]['regions'][region]['serial'] = serial or game_lookup[key]['regions'][region]['serial']
-                            game_lookup[key]['regions'][region]['crc'] = crc or game_lookup[key]['regions'][region]['crc']
-                        elif len(new_cheats) > 0 and len(existing_cheats) == 0:
-                            game_lookup[key]['regions'][region]['cheats'] = new_cheats
+                    # Decide whether to replace
+                    existing_cheats = cheat_lists[idx] or []
+                    if prefer_larger and len(cheats) > len(existing_cheats):
+                        cheat_lists[idx] = cheats
+                        serials[idx] = serial or serials[idx]
+                        crcs[idx] = crc or crcs[idx]
+                    elif len(cheats) > 0 and len(existing_cheats) == 0:
+                        cheat_lists[idx] = cheats
         
         # Convert back to list
-        merged['games'] = list(game_lookup.values())
+        # (statistics are gathered in the same pass)
+        games_out = [{'title': t, 'regions': {}} for t in game_titles]
+        by_region = Counter()
+        games_by_region = Counter()
+        cheat_counts = []
+        for gi, region, serial, crc, cheats in zip(game_of, region_names, serials, crcs, cheat_lists):
+            games_out[gi]['regions'][region] = {
+                'serial': serial,
+                'crc': crc,
+                'cheats': cheats
+            }
+            cheat_count = len(cheats or [])
+            by_region[region] += cheat_count
+            games_by_region[region] += 1
+            cheat_counts.append(cheat_count)
+        total_cheats = sum(cheat_counts)
+        merged['games'] = games_out
         merged['merge_date'] = datetime.now().isoformat()
-        merged['total_games'] = len(merged['games'])
-        
-        # Count total cheats
-        total_cheats = 0
-        for game in merged['games']:
-            for region_data in game.get('regions', {}).values():
-                total_cheats += len(region_data.get('cheats', []))
+        merged['total_games'] = len(games_out)
         
         merged['total_cheats'] = total_cheats
+        stats = {
+            'total_games': len(games_out),
+            'total_cheats': total_cheats,
+            'by_region': dict(by_region),
+            'games_by_region': dict(games_by_region),
+            'max_cheats_per_game': max(cheat_counts, default=0),
+            'avg_cheats_per_game': statistics.fmean(cheat_counts) if cheat_counts else 0
+        }
         
-        return merged
+        return merged, stats
     
     @staticmethod
-    def get_game_cheats(database: Dict, game_title: str, serial: str = None, region: str = None) -> List[Dict]:
+    def build_index(database: Dict) -> Dict:
+        """
+        Index database['games'] by normalized title and by upper-cased region serial
+        (each mapping to game indices in list order), for repeated get_game_cheats
+        lookups. The index is a snapshot: build a new one after editing the games.
+        """
+        games = database.get('games', [])
+        by_title = {}
+        by_serial = {}
+        for i, game in enumerate(games):
+            by_title.setdefault(CheatsDatabase.normalize_game_title(game.get('title', '')), []).append(i)
+            for reg_data in game.get('regions', {}).values():
+                serial_hits = by_serial.setdefault((reg_data.get('serial') or '').upper(), [])
+                if not serial_hits or serial_hits[-1] != i:
+                    serial_hits.append(i)
+        return {'games': games, 'by_title': by_title, 'by_serial': by_serial}
+    
+    @staticmethod
+    def get_game_cheats(database: Dict, game_title: str, serial: str = None, region: str = None,
+                        index: Dict = None) -> List[Dict]:
         """
         Search database for cheats by game title and optional serial/region.
+        index: optional build_index(database) result, reused across lookups; without one
+        the games are scanned once, which is cheaper than indexing for a single lookup.
         """
         results = []
         norm_title = CheatsDatabase.normalize_game_title(game_title)
+        if index is None:
+            matches = (g for g in database.get('games', [])
+                       if CheatsDatabase.normalize_game_title(g.get('title', '')) == norm_title)
+        else:
+            hits = index['by_title'].get(norm_title, [])
+            if serial and hits:
+                # narrow to games that have a region with this serial
+                serial_hits = set(index['by_serial'].get(serial.upper(), ()))
+                hits = [i for i in hits if i in serial_hits]
+            matches = (index['games'][i] for i in hits)
         
-        for game in database.get('games', []):
-            if CheatsDatabase.normalize_game_title(game.get('title', '')) == norm_title:
-                for reg, reg_data in game.get('regions', {}).items():
-                    # Check region match
-                    if region and reg != region:
-                        continue
-                    
-                    # Check serial match
-                    if serial and reg_data.get('serial', '').upper() != serial.upper():
-                        continue
-                    
-                    cheats = reg_data.get('cheats', [])
-                    if cheats:
-                        results.append({
-                            'region': reg,
-                            'serial': reg_data.get('serial'),
-                            'crc': reg_data.get('crc'),
-                            'cheats': cheats
-                        })
+        for game in matches:
+            for reg, reg_data in game.get('regions', {}).items():
+                # Check region match
+                if region and reg != region:
+                    continue
+                
+                # Check serial match
+                if serial and (reg_data.get('serial') or '').upper() != serial.upper():
+                    continue
+                
+                cheats = reg_data.get('cheats', [])
+                if cheats:
+                    results.append({
+                        'region': reg,
+                        'serial': reg_data.get('serial'),
+                        'crc': reg_data.get('crc'),
+                        'cheats': cheats
+                    })
         
         return results
     
@@ -178,12 +283,29 @@ class CheatsDatabase:
         return stats
 
 
+def _remove_tree(path: str):
+    """rmtree that skips a missing folder and retries entries that failed (e.g. read-only files on Windows)."""
+    if not os.path.exists(path):
+        return
+    
+    def retry(func, p, _exc):
+        try:
+            os.chmod(p, stat.S_IWRITE)
+            func(p)
+        except OSError:
+            pass
+    
+    shutil.rmtree(path, onerror=retry)
+
+
 def merge_all_cheats(local_folder: str = './PS2 Cheats', 
                      existing_db: str = 'ps2_cheats_database.json',
                      output_db: str = 'ps2_cheats_database_merged.json',
-                     use_github: bool = True):
+                     use_github: bool = True,
+                     scan_cache: str = None):
     """
     Merge all available cheat sources into one database.
+    scan_cache: optional LocalCheatsScanner parse cache for the local folder scan.
     """
     logger.info("=== CHEAT DATABASE MERGER ===")
     
@@ -192,7 +314,7 @@ def merge_all_cheats(local_folder: str = './PS2 Cheats',
     from scan_local_cheats import LocalCheatsScanner
     
     if os.path.exists(local_folder):
-        scan_results = LocalCheatsScanner.scan_folder(local_folder)
+        scan_results = LocalCheatsScanner.scan_folder(local_folder, cache_path=scan_cache)
         local_db = LocalCheatsScanner.build_database(scan_results)
         logger.info(f"Local: {local_db['total_games']} games, cheats scanned")
     else:
@@ -204,10 +326,10 @@ def merge_all_cheats(local_folder: str = './PS2 Cheats',
     # Step 2: Download and parse GitHub cheats (optional)
     if use_github:
         logger.info("\nStep 2: Fetching GitHub cheats...")
+        github_folder = tempfile.mkdtemp(prefix='github_cheats_')
         try:
             from fetch_github_cheats import download_github_cheats, scan_pnach_files, merge_cheats_to_database
             
-            github_folder = './github_cheats_temp'
             cheat_folder = download_github_cheats(github_folder)
             pnach_files = scan_pnach_files(cheat_folder)
             
@@ -216,17 +338,18 @@ def merge_all_cheats(local_folder: str = './PS2 Cheats',
             databases_to_merge.append(github_db)
             
             logger.info(f"GitHub: {len(github_db.get('games', []))} games fetched")
-            
-            # Cleanup
-            import shutil
-            shutil.rmtree(github_folder, ignore_errors=True)
         
         except Exception as e:
             logger.error(f"Failed to fetch GitHub cheats: {e}")
+        finally:
+            # Cleanup in the background so merging doesn't wait on thousands of deletes;
+            # anything left behind is in the system temp folder
+            threading.Thread(target=_remove_tree, args=(github_folder,), daemon=True).start()
     
     # Step 3: Load existing database
     logger.info("\nStep 3: Loading existing database...")
     if os.path.exists(existing_db):
+        # fully read before merging, so a truncated file is skipped rather than half-merged
         existing = CheatsDatabase.load_database(existing_db)
         if existing.get('games'):
             databases_to_merge.append(existing)
@@ -234,7 +357,7 @@ def merge_all_cheats(local_folder: str = './PS2 Cheats',
     
     # Step 4: Merge all
     logger.info("\nStep 4: Merging all databases...")
-    merged_db = CheatsDatabase.merge_databases(databases_to_merge, prefer_larger=True)
+    merged_db, stats = CheatsDatabase.merge_databases_with_stats(databases_to_merge, prefer_larger=True)
     
     # Step 5: Save
     logger.info("\nStep 5: Saving merged database...")
@@ -242,7 +365,6 @@ def merge_all_cheats(local_folder: str = './PS2 Cheats',
     
     # Step 6: Print statistics
     logger.info("\n=== STATISTICS ===")
-    stats = CheatsDatabase.get_statistics(merged_db)
     logger.info(f"Total games: {stats['total_games']}")
     logger.info(f"Total cheats: {stats['total_cheats']}")
     logger.info(f"Average cheats/game: {stats['avg_cheats_per_game']:.1f}")
@@ -1,11 +1,34 @@
-from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
+import asyncio
 import re
 import json
 import os
+import time
+from datetime import datetime
+import requests
+
+try:
+    from playwright.async_api import async_playwright  # optional: only needed to fetch pages
+except ImportError:
+    async_playwright = None
+try:
+    from selectolax.lexbor import LexborHTMLParser  # optional: C (lexbor) HTML parser
+except ImportError:
+    LexborHTMLParser = None
+try:
+    import lxml  # noqa: F401  # BeautifulSoup fallback parser, faster than html.parser
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
 
 HEADERS = {'User-Agent': 'PCSX2-Manager/1.0 (+https://example)'}
 CACHE_DIR = 'cheat_cache'
+# cached results younger than this are used as-is; older ones are revalidated with a HEAD request
+CACHE_TTL = 24 * 3600
+# persistent browser profile: cookies and Chromium's HTTP cache survive between runs
+PROFILE_DIR = '.pw_profile'
+# only the HTML is needed for code extraction; these requests are dropped
+BLOCKED_RESOURCES = frozenset({'image', 'font', 'stylesheet', 'media', 'other'})
 os.makedirs(CACHE_DIR, exist_ok=True)
 
 TARGETS = [
@@ -14,87 +37,168 @@ TARGETS = [
 ]
 
 HEX_PAIR = re.compile(r'\b[0-9A-Fa-f]{8}\b')
-PNACH_LINE = re.compile(r'^patch=', re.I)
+# over all code-block text at once, in document order: a whole pnach line, or the next two
+# 8-hex words on one line whatever separates them ("A V", "A:V", "A,V", "A = V", text between)
+CODE_FULL = re.compile(r'^[^\S\n]*(patch=[^\n]*?)[^\S\n]*$|\b([0-9A-Fa-f]{8})\b[^\n]*?\b([0-9A-Fa-f]{8})\b', re.M | re.I)
+POST_CLASS_RE = re.compile(r'postbody|message|postcontent|post|content|messageContent', re.I)
+
+
+def _page_texts(html):
+    """Return (texts of <pre>/<code> blocks, texts of post-content containers) for a page."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        blocks = [n.text(separator='\n', strip=True) for n in tree.css('pre, code')]
+        posts = [n.text(separator='\n', strip=True) for n in tree.css('[class]')
+                 if POST_CLASS_RE.search(n.attributes.get('class') or '')]
+        return blocks, posts
+    soup = BeautifulSoup(html, BS_PARSER)
+    blocks = [b.get_text('\n', strip=True) for b in soup.find_all(['pre','code'])]
+    # one DOM pass for all post-container class names
+    posts = [div.get_text('\n', strip=True) for div in soup.find_all(class_=POST_CLASS_RE)]
+    return blocks, posts
 
 
 def extract_codes_from_html(html):
     codes = []
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        for b in soup.find_all(['pre','code']):
-            txt = b.get_text('\n', strip=True)
-            for ln in txt.splitlines():
-                ln = ln.strip()
-                if not ln:
-                    continue
-                if PNACH_LINE.match(ln):
-                    codes.append(ln)
-                    continue
-                hexs = HEX_PAIR.findall(ln)
-                if len(hexs) >= 2:
-                    for i in range(0, len(hexs)-1, 2):
-                        codes.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
-                else:
-                    m = re.search(r'([0-9A-Fa-f]{1,8})\s+([0-9A-Fa-f]{1,8})', ln)
-                    if m:
-                        a = m.group(1).upper().rjust(8,'0')
-                        v = m.group(2).upper().rjust(8,'0')
-                        codes.append(f"{a} {v}")
+        blocks, posts = _page_texts(html)
+        for pnach, a, v in CODE_FULL.findall('\n'.join(blocks)):
+            codes.append(pnach or f"{a.upper()} {v.upper()}")
         # search post content containers
-        for cls in ('postbody','message','postcontent','post','content','messageContent'):
-            for div in soup.find_all(class_=re.compile(cls, re.I)):
-                txt = div.get_text('\n', strip=True)
-                hexs = HEX_PAIR.findall(txt)
-                if len(hexs) >= 2:
-                    for i in range(0, len(hexs)-1, 2):
-                        codes.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
+        for txt in posts:
+            hexs = HEX_PAIR.findall(txt)
+            if len(hexs) >= 2:
+                for i in range(0, len(hexs)-1, 2):
+                    codes.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
     except Exception:
         pass
     # dedupe preserving order
-    seen = set(); out = []
-    for c in codes:
-        if c not in seen:
-            seen.add(c); out.append(c)
-    return out
+    return list(dict.fromkeys(codes))
 
 
-def run():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(user_agent=HEADERS['User-Agent'])
-        page = context.new_page()
-        results = {}
-        for serial, url in TARGETS:
-            print('Visiting', url)
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _head_validators(url):
+    """(ETag, Last-Modified) of url from a HEAD request; (None, None) when unavailable."""
+    try:
+        r = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+        return r.headers.get('ETag'), r.headers.get('Last-Modified')
+    except Exception:
+        return None, None
+
+
+def _cached_result(path, url):
+    """
+    Cached entries for url when still valid: younger than CACHE_TTL, or unchanged
+    according to the server's ETag/Last-Modified (a HEAD request, only made for
+    stale entries). Returns None when the page has to be fetched.
+    """
+    cached = _load_cache(path)
+    if not isinstance(cached, list) or not cached or not isinstance(cached[0], dict) or cached[0].get('link') != url:
+        return None
+    if time.time() - os.path.getmtime(path) < CACHE_TTL:
+        return cached
+    etag, last_modified = _head_validators(url)
+    if (etag and etag == cached[0].get('etag')) or (last_modified and last_modified == cached[0].get('last_modified')):
+        os.utime(path)  # still current: restart the TTL
+        return cached
+    return None
+
+
+# pages fetched at once; keeps per-host request rates polite
+MAX_CONCURRENT_PAGES = 4
+
+
+async def _filter_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _fetch_one(context, sem, serial, url):
+    """Render one target in its own page and return its result entries (cached on success)."""
+    async with sem:
+        print('Visiting', url)
+        # fresh page per target so no DOM state carries over
+        page = await context.new_page()
+        try:
+            # the DOM is all we need; short delay for JS-rendered code blocks
+            response = await page.goto(url, timeout=30000, wait_until='domcontentloaded')
+            # validators for the next revalidation come with the page itself
+            headers = response.headers if response is not None else {}
+            etag, last_modified = headers.get('etag'), headers.get('last-modified')
+            await page.wait_for_timeout(1000)
+            content = await page.content()
+            # also try innerText of body
             try:
-                page.goto(url, timeout=30000)
-                # wait for network idle and short delay for dynamic content
-                page.wait_for_load_state('networkidle', timeout=15000)
-                page.wait_for_timeout(1000)
-                content = page.content()
-                # also try innerText of body
-                try:
-                    body_text = page.inner_text('body')
-                except Exception:
-                    body_text = ''
-                codes = extract_codes_from_html(content)
-                # if no codes, try scanning body text for hex pairs
-                if not codes and body_text:
-                    hexs = HEX_PAIR.findall(body_text)
-                    if len(hexs) >= 2:
-                        for i in range(0, len(hexs)-1, 2):
-                            codes.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
-                print(' Found codes:', len(codes))
-                results[serial] = [{'source': 'playwright', 'link': url, 'codes': codes}]
-                # save cache
-                path = os.path.join(CACHE_DIR, f"{serial}.json")
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(results[serial], f, ensure_ascii=False, indent=2)
-            except Exception as e:
-                print(' Error visiting', url, e)
-                results[serial] = []
-        browser.close()
-    # write summary
+                body_text = await page.inner_text('body')
+            except Exception:
+                body_text = ''
+        except Exception as e:
+            print(' Error visiting', url, e)
+            return []
+        finally:
+            await page.close()
+    codes = extract_codes_from_html(content)
+    # if no codes, try scanning body text for hex pairs
+    if not codes and body_text:
+        hexs = HEX_PAIR.findall(body_text)
+        if len(hexs) >= 2:
+            for i in range(0, len(hexs)-1, 2):
+                codes.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
+    print(' Found codes:', len(codes), f'({serial})')
+    entries = [{'source': 'playwright', 'link': url, 'codes': codes,
+                'fetched_at': datetime.now().isoformat(), 'etag': etag, 'last_modified': last_modified}]
+    # save cache
+    try:
+        path = os.path.join(CACHE_DIR, f"{serial}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(' Error caching', serial, e)
+    return entries
+
+
+async def arun():
+    results = {}
+    pending = []
+    # stale cache entries are revalidated with blocking HEAD requests: run those side by side
+    checked = await asyncio.gather(*(asyncio.to_thread(_cached_result, os.path.join(CACHE_DIR, f"{serial}.json"), url)
+                                     for serial, url in TARGETS))
+    for (serial, url), cached in zip(TARGETS, checked):
+        if cached is not None:
+            print('Cached', url)
+            results[serial] = cached
+        else:
+            pending.append((serial, url))
+    if pending:
+        if async_playwright is None:
+            raise RuntimeError('playwright is not installed (pip install playwright)')
+        async with async_playwright() as p:
+            context = await p.chromium.launch_persistent_context(user_data_dir=PROFILE_DIR, headless=True,
+                                                                 user_agent=HEADERS['User-Agent'])
+            await context.route("**/*", _filter_resources)
+            # targets load concurrently, at most MAX_CONCURRENT_PAGES at a time
+            sem = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            fetched = await asyncio.gather(*(_fetch_one(context, sem, serial, url) for serial, url in pending))
+            await context.close()
+        for (serial, _), entries in zip(pending, fetched):
+            results[serial] = entries
+    _write_summary({serial: results[serial] for serial, _ in TARGETS})
+
+
+def run():
+    asyncio.run(arun())
+
+
+def _write_summary(results):
     with open('playwright_fetch_summary.json', 'w', encoding='utf-8') as f:
         json.dump(results, f, ensure_ascii=False, indent=2)
     print('Done. Summary written to playwright_fetch_summary.json')
@@ -1,38 +1,60 @@
 import json
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 with open('cheat_fetch_summary.json', 'r', encoding='utf-8') as f:
     data = json.load(f)
 
+# one pooled session: repeat requests to the same hosts reuse their connections
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.3))
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+
+
+def fetch_and_parse(item):
+    """Fetch one (serial, entry) and return the report lines for it."""
+    serial, e = item
+    link = e.get('link')
+    out = ['\n  original link: ' + str(link)]
+    try:
+        r = session.get(link, headers={'User-Agent':'PCSX2-Manager/1.0'}, timeout=10, allow_redirects=True)
+        out.append('   final url: ' + r.url)
+        soup = BeautifulSoup(r.text, 'html.parser')
+        blocks = soup.find_all(['pre','code'])
+        if blocks:
+            out.append(f'   code blocks found: {len(blocks)}')
+            for i, b in enumerate(blocks[:3], 1):
+                text = b.get_text('\n', strip=True)
+                sample = '\n'.join(text.splitlines()[:12])
+                out.append(f'    block #{i} sample:\n{sample}')
+        else:
+            # fallback: show nearby text around serial
+            U = (r.text or '').upper()
+            idx = U.find(serial.upper())
+            if idx!=-1:
+                seg = r.text[max(0, idx-400):idx+400]
+                out.append('   snippet around serial:')
+                out.append(seg[:800])
+            else:
+                out.append('   no code blocks and serial not found in page body')
+    except Exception as ex:
+        out.append(f'   fetch error: {ex}')
+    return out
+
+
+# fetch everything concurrently (network-bound), then print in the original order
+worklist = [(serial, e) for serial, entries in data.items() for e in entries]
+with ThreadPoolExecutor(max_workers=8) as executor:
+    reports = iter(executor.map(fetch_and_parse, worklist))
+
 for serial, entries in data.items():
     print('\n==', serial, '==')
     if not entries:
         print('  (no entries)')
         continue
-    for e in entries:
-        link = e.get('link')
-        print('\n  original link:', link)
-        try:
-            r = requests.get(link, headers={'User-Agent':'PCSX2-Manager/1.0'}, timeout=10, allow_redirects=True)
-            print('   final url:', r.url)
-            soup = BeautifulSoup(r.text, 'html.parser')
-            blocks = soup.find_all(['pre','code'])
-            if blocks:
-                print('   code blocks found:', len(blocks))
-                for i, b in enumerate(blocks[:3], 1):
-                    text = b.get_text('\n', strip=True)
-                    sample = '\n'.join(text.splitlines()[:12])
-                    print(f'    block #{i} sample:\n{sample}')
-            else:
-                # fallback: show nearby text around serial
-                U = (r.text or '').upper()
-                idx = U.find(serial.upper())
-                if idx!=-1:
-                    seg = r.text[max(0, idx-400):idx+400]
-                    print('   snippet around serial:')
-                    print(seg[:800])
-                else:
-                    print('   no code blocks and serial not found in page body')
-        except Exception as ex:
-            print('   fetch error:', ex)
+    for _ in entries:
+        print('\n'.join(next(reports)))
@@ -8,6 +8,12 @@ import os
 import sys
 import logging
 from datetime import datetime
+from importlib.util import find_spec
+
+try:
+    import ijson  # optional: stream games instead of loading the whole database
+except ImportError:
+    ijson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,15 +34,10 @@ def check_dependencies():
     """Check required dependencies."""
     logger.info("Checking dependencies...")
     
-    required = ['json', 're', 'zipfile', 'pathlib']
     optional = ['requests', 'bs4']
     
-    missing_optional = []
-    for mod in optional:
-        try:
-            __import__(mod)
-        except ImportError:
-            missing_optional.append(mod)
+    # find_spec only locates the package; importing it here would run its top-level code for nothing
+    missing_optional = [mod for mod in optional if find_spec(mod) is None]
     
     if missing_optional:
         logger.warning(f"Optional modules not found: {', '.join(missing_optional)}")
@@ -57,10 +58,11 @@ def step_1_scan_local():
         return None
     
     try:
-        from scan_local_cheats import LocalCheatsScanner
+        from scan_local_cheats import LocalCheatsScanner, DEFAULT_SCAN_CACHE
         
         logger.info(f"Scanning folder: {local_folder}")
-        results = LocalCheatsScanner.scan_folder(local_folder)
+        # cached, so the rescan in step 3 only parses files that changed
+        results = LocalCheatsScanner.scan_folder(local_folder, cache_path=DEFAULT_SCAN_CACHE)
         
         logger.info(f"✓ Found {len(results)} PNACH files")
         
@@ -115,6 +117,7 @@ def step_3_merge():
     
     try:
         from merge_cheats_databases import merge_all_cheats
+        from scan_local_cheats import DEFAULT_SCAN_CACHE
         
         logger.info("Merging all cheat sources...")
         logger.info("  - Local PS2 Cheats folder")
@@ -123,7 +126,8 @@ def step_3_merge():
         
         merged_db = merge_all_cheats(
             use_github=True,
-            output_db='ps2_cheats_database_merged.json'
+            output_db='ps2_cheats_database_merged.json',
+            scan_cache=DEFAULT_SCAN_CACHE
         )
         
         logger.info(f"✓ Merged database created successfully!")
@@ -139,6 +143,30 @@ def step_3_merge():
         return None
 
 
+def _iter_db_games(db_path):
+    """Iterate the games of a database file, streaming with ijson when available.
+
+    Returns None when the file is loaded whole and has no 'games' field.
+    """
+    if ijson is None:
+        from _fastjson import load_path
+        db = load_path(db_path)
+        return iter(db['games']) if 'games' in db else None
+
+    def stream():
+        with open(db_path, 'rb') as f:
+            yield from ijson.items(f, 'games.item', use_float=True)
+    return stream()
+
+
+def _has_games_field(db_path):
+    if ijson is None:
+        return True  # already checked by _iter_db_games
+    with open(db_path, 'rb') as f:
+        return any(prefix == '' and event == 'map_key' and value == 'games'
+                   for prefix, event, value in ijson.parse(f))
+
+
 def step_4_verify():
     """Step 4: Verify merged database."""
     logger.info("\n" + "="*70)
@@ -152,23 +180,16 @@ def step_4_verify():
         return False
     
     try:
-        import json
-        
-        with open(db_path, 'r', encoding='utf-8') as f:
-            db = json.load(f)
-        
-        # Verify structure
-        if 'games' not in db:
+        games = _iter_db_games(db_path)
+        if games is None:
             logger.error("Invalid database structure: missing 'games' field")
             return False
         
-        games = db['games']
-        logger.info(f"✓ Database structure valid")
-        logger.info(f"✓ Total games: {len(games)}")
-        
-        # Count cheats by region
+        # Count cheats by region, one game at a time
+        len_games = 0
         regions = {}
         for game in games:
+            len_games += 1
             for region, reg_data in game.get('regions', {}).items():
                 if region not in regions:
                     regions[region] = {'games': 0, 'cheats': 0}
@@ -177,6 +198,13 @@ def step_4_verify():
                 regions[region]['games'] += 1
                 regions[region]['cheats'] += len(cheats)
         
+        if not len_games and not _has_games_field(db_path):
+            logger.error("Invalid database structure: missing 'games' field")
+            return False
+        
+        logger.info(f"✓ Database structure valid")
+        logger.info(f"✓ Total games: {len_games}")
+        
         logger.info("\nCheats by region:")
         for region in sorted(regions.keys()):
             reg = regions[region]
@@ -245,9 +273,9 @@ NEXT STEPS:
     """
     
     try:
-        import json
-        with open('ps2_cheats_database_merged.json', 'r') as f:
-            db = json.load(f)
+        from _fastjson import loads
+        with open('ps2_cheats_database_merged.json', 'rb') as f:
+            db = loads(f.read())
         total_games = len(db.get('games', []))
     except:
         total_games = 'N/A'
@@ -16,10 +16,11 @@ w = main.MainWindow()
 # Point Cheats tab to tmp folder and refresh
 w.cheats_tab.cheats_dir.setText(tmp)
 w.cheats_tab.refresh_list()
-count = w.cheats_tab.list.count()
-print('Installed PNACH list count:', count)
-for i in range(count):
-    print(' -', w.cheats_tab.list.item(i).text())
+lst = w.cheats_tab.list
+items = [lst.item(i).text() for i in range(lst.count())]
+print('Installed PNACH list count:', len(items))
+if items:
+    print('\n'.join(f' - {t}' for t in items))
 
 # Test fetcher directly for a sample CRC and serial
 keys = ['DEADBEEF', 'SLUS-21234']
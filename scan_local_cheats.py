@@ -7,13 +7,23 @@ Integrates with fetch_github_cheats.py for comprehensive cheat database.
 import os
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from _fastjson import dump
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# where callers that opt in to the scan cache usually keep it
+DEFAULT_SCAN_CACHE = './.pnach_cache.json'
+# bump whenever parse_pnach_file's output changes, so older cached results are discarded
+SCAN_CACHE_VERSION = 1
+
+_DROP_SPACES = {32: None}
+
 
 class LocalCheatsScanner:
     """Scan and parse local PNACH cheat files."""
@@ -23,17 +33,27 @@ class LocalCheatsScanner:
     # CRC can be 4-8 hex digits (will be normalized to 8)
     # Title can contain spaces and dashes  
     # Serial is uppercase letters + numbers with optional dashes/spaces
+    # Case is spelled out in the classes instead of re.IGNORECASE
     FILENAME_PATTERN = re.compile(
-        r'^([0-9A-Fa-f]{4,8})\s*-\s*(.+?)\s+([A-Z0-9\s\-\.]+?)\.pnach$',
-        re.IGNORECASE
+        r'^([0-9A-Fa-f]{4,8})\s*-\s*(.+?)\s+([A-Za-z0-9\s\-\.]+?)\.[Pp][Nn][Aa][Cc][Hh]$'
     )
+    # One pass per (stripped) PNACH line; m.lastgroup names the kind of line
+    _LINE_RX = re.compile(
+        r'gametitle=(?P<gametitle>.*)'
+        r'|serial=(?P<serial>.*)'
+        r'|\[(?P<section>.*)\]'
+        r'|code\d+=(?P<code>.+)'
+        r'|(?P<patch>patch=.*)'
+    )
+    # First serial code in the (uppercased) serial part of a filename
+    _SERIAL_EXTRACT = re.compile(r'[A-Z]+[A-Z0-9\-]*[0-9]+')
     
     @staticmethod
-    def parse_pnach_file(filepath: str) -> Dict:
-        """Parse a single PNACH file and extract cheat information."""
+    def parse_pnach_file(filepath: str, filename: Optional[str] = None) -> Dict:
+        """Parse a single PNACH file and extract cheat information (filename: basename if already known)."""
         result = {
             'filepath': filepath,
-            'filename': os.path.basename(filepath),
+            'filename': filename or os.path.basename(filepath),
             'crc': None,
             'serial': None,
             'game_title': None,
@@ -43,46 +63,48 @@ class LocalCheatsScanner:
         
         try:
             with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Parse file content
-            lines = content.split('\n')
-            current_cheat = None
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('//'):
-                    continue
+                # Parse file content, a line at a time
+                current_cheat = None
+                match_line = LocalCheatsScanner._LINE_RX.fullmatch
                 
-                # Extract header info
-                if line.startswith('gametitle='):
-                    result['game_title'] = line.split('=', 1)[1].strip()
-                elif line.startswith('serial='):
-                    result['serial'] = line.split('=', 1)[1].strip().upper()
-                elif line.startswith('[') and line.endswith(']'):
-                    # Start of new cheat
-                    if current_cheat and current_cheat.get('codes'):
-                        result['cheats'].append(current_cheat)
+                for raw in f:
+                    line = raw.strip()
                     
-                    cheat_name = line[1:-1].strip()
-                    cheat_name = cheat_name.replace('Cheats/', '', 1) if cheat_name.startswith('Cheats/') else cheat_name
-                    current_cheat = {
-                        'name': cheat_name,
-                        'codes': [],
-                        'description': ''
-                    }
-                
-                elif current_cheat is not None and (line.startswith('code') or line.startswith('patch=')):
-                    # Parse cheat code - handle both code= and patch= formats
-                    if line.startswith('code'):
-                        match = re.match(r'code\d+=(.+)', line)
-                        if match:
-                            current_cheat['codes'].append(match.group(1).strip())
-                    elif line.startswith('patch='):
-                        # Add patch line as-is (it's already a complete code)
-                        current_cheat['codes'].append(line)
+                    # Skip empty lines and comments
+                    if not line or line.startswith('//'):
+                        continue
+                    
+                    m = match_line(line)
+                    if m is None:
+                        continue
+                    kind = m.lastgroup
+                    val = m.group(kind)
+                    
+                    # Extract header info
+                    if kind == 'gametitle':
+                        result['game_title'] = val.strip()
+                    elif kind == 'serial':
+                        result['serial'] = val.strip().upper()
+                    elif kind == 'section':
+                        # Start of new cheat
+                        if current_cheat and current_cheat.get('codes'):
+                            result['cheats'].append(current_cheat)
+                        
+                        cheat_name = val.strip()
+                        cheat_name = cheat_name.replace('Cheats/', '', 1) if cheat_name.startswith('Cheats/') else cheat_name
+                        current_cheat = {
+                            'name': cheat_name,
+                            'codes': [],
+                            'description': ''
+                        }
+                    
+                    elif current_cheat is not None:
+                        # Parse cheat code - handle both codeN= and patch= formats
+                        if kind == 'patch':
+                            # Add patch line as-is (it's already a complete code)
+                            current_cheat['codes'].append(val)
+                        else:
+                            current_cheat['codes'].append(val.strip())
             
             # Add last cheat
             if current_cheat and current_cheat.get('codes'):
@@ -98,7 +120,8 @@ class LocalCheatsScanner:
             if not result['serial']:
                 result['serial'] = serial_from_filename
             if not result['game_title']:
-                result['game_title'] = result['filename'].replace('.pnach', '')
+                fn = result['filename']
+                result['game_title'] = fn[:-6] if fn.endswith('.pnach') else fn
             
             # Normalize values
             if result['crc']:
@@ -119,62 +142,152 @@ class LocalCheatsScanner:
         if match:
             crc = match.group(1).upper()
             # Pad CRC to 8 digits with leading zeros
-            crc = crc.zfill(8)
+            if len(crc) < 8:
+                crc = crc.zfill(8)
             serial_str = match.group(3).upper().strip() if match.group(3) else None
             if serial_str:
                 # Extract the first serial code if multiple are present
                 # Take the first continuous alphanumeric+dash sequence
-                serial_match = re.search(r'([A-Z]+[A-Z0-9\-]*[0-9]+)', serial_str)
-                serial = serial_match.group(1) if serial_match else serial_str
+                serial_match = LocalCheatsScanner._SERIAL_EXTRACT.search(serial_str)
+                serial = serial_match.group() if serial_match else serial_str
                 # Normalize spaces to nothing in serials
-                serial = serial.replace(' ', '')
+                serial = serial.translate(_DROP_SPACES)
                 return crc, serial
             return crc, None
         return None, None
     
     @staticmethod
-    def scan_folder(folder_path: str) -> List[Dict]:
-        """Scan a folder for all PNACH files and parse them."""
+    def _iter_pnach(path: str):
+        """
+        Yield DirEntry objects for .pnach files under path (entry types come from scandir, no extra stat).
+        Like os.walk: symlinked files are listed, symlinked folders are not descended into,
+        and folders that can't be read (or vanish mid-scan) are skipped.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"Skipping {path}: {e}")
+            return
+        subdirs = []
+        # files of a folder before its subfolders, the same order os.walk gave
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith('.pnach') and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        for sub in subdirs:
+            yield from LocalCheatsScanner._iter_pnach(sub)
+    
+    @staticmethod
+    def _load_scan_cache(cache_path: Optional[str]) -> Dict:
+        """abspath -> {mtime_ns, size, parsed} from cache_path; empty if missing, unreadable or outdated."""
+        if not cache_path or not os.path.isfile(cache_path):
+            return {}
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable scan cache {cache_path}: {e}")
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != SCAN_CACHE_VERSION:
+            return {}
+        files = cache.get('files')
+        return files if isinstance(files, dict) else {}
+    
+    @staticmethod
+    def _save_scan_cache(cache_path: str, cache: Dict):
+        tmp = cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': SCAN_CACHE_VERSION, 'files': cache}, f, ensure_ascii=False)
+            os.replace(tmp, cache_path)
+        except Exception as e:
+            logger.warning(f"Could not write scan cache {cache_path}: {e}")
+    
+    @staticmethod
+    def scan_folder(folder_path: str, workers: Optional[int] = None,
+                    cache_path: Optional[str] = None) -> List[Dict]:
+        """
+        Scan a folder for all PNACH files and parse them.
+        Files are parsed on a thread pool (the work is mostly open/read syscalls);
+        workers=None picks a size from the CPU count, workers=1 parses inline.
+        With cache_path set (e.g. DEFAULT_SCAN_CACHE), parse results are cached there keyed
+        by (path, mtime_ns, size), so unchanged files are not re-parsed on the next scan.
+        """
         results = []
         
         if not os.path.isdir(folder_path):
             logger.error(f"Folder not found: {folder_path}")
             return results
         
-        pnach_files = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file.endswith('.pnach'):
-                    pnach_files.append(os.path.join(root, file))
+        entries = list(LocalCheatsScanner._iter_pnach(folder_path))
+        logger.info(f"Found {len(entries)} PNACH files in {folder_path}")
         
-        logger.info(f"Found {len(pnach_files)} PNACH files in {folder_path}")
+        cache = LocalCheatsScanner._load_scan_cache(cache_path)
+        results = [None] * len(entries)
+        stamps = [None] * len(entries)
+        todo = []
+        for i, entry in enumerate(entries):
+            try:
+                st = entry.stat()
+                stamps[i] = (os.path.abspath(entry.path), st.st_mtime_ns, st.st_size)
+            except OSError:
+                todo.append(i)
+                continue
+            hit = cache.get(stamps[i][0])
+            if hit and hit.get('mtime_ns') == stamps[i][1] and hit.get('size') == stamps[i][2]:
+                # report the file under the path it was found by this time
+                results[i] = dict(hit['parsed'], filepath=entry.path, filename=entry.name)
+            else:
+                todo.append(i)
+        if cache_path:
+            logger.info(f"Scan cache: {len(entries) - len(todo)} unchanged, {len(todo)} to parse")
         
-        for filepath in pnach_files:
-            parsed = LocalCheatsScanner.parse_pnach_file(filepath)
-            results.append(parsed)
+        paths = [entries[i].path for i in todo]
+        names = [entries[i].name for i in todo]
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+        if workers <= 1 or len(todo) <= 1:
+            parsed = list(map(LocalCheatsScanner.parse_pnach_file, paths, names))
+        else:
+            # map keeps results in file order
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                parsed = list(ex.map(LocalCheatsScanner.parse_pnach_file, paths, names))
+        for i, res in zip(todo, parsed):
+            results[i] = res
+        
+        if cache_path and todo:
+            # drop entries for files under this folder that are gone, then record this scan
+            root = os.path.join(os.path.abspath(folder_path), '')
+            cache = {p: v for p, v in cache.items() if not p.startswith(root)}
+            for stamp, res in zip(stamps, results):
+                if stamp is not None and 'error' not in res:
+                    cache[stamp[0]] = {'mtime_ns': stamp[1], 'size': stamp[2], 'parsed': res}
+            LocalCheatsScanner._save_scan_cache(cache_path, cache)
         
         return results
     
-    @staticmethod
-    def determine_region(serial: str) -> str:
+    # serial prefix -> region
+    _REGION_BY_PREFIX = {
+        'SLUS': 'NTSC-U',
+        'SLES': 'PAL',
+        'SLPS': 'NTSC-J',
+        'SCPS': 'NTSC-J',
+        'SLKA': 'NTSC-K',
+        'SLPM': 'NTSC-J',
+    }
+    
+    @classmethod
+    def determine_region(cls, serial: str) -> str:
         """Determine region from PS2 serial code."""
         if not serial:
             return 'Unknown'
-        
-        serial = serial.upper()
-        
-        if serial.startswith('SLUS'):
-            return 'NTSC-U'
-        elif serial.startswith('SLES'):
-            return 'PAL'
-        elif serial.startswith('SLPS') or serial.startswith('SCPS'):
-            return 'NTSC-J'
-        elif serial.startswith('SLKA'):
-            return 'NTSC-K'
-        elif serial.startswith('SLPM'):
-            return 'NTSC-J'
-        else:
-            return 'Unknown'
+        return cls._REGION_BY_PREFIX.get(serial[:4].upper(), 'Unknown')
     
     @staticmethod
     def build_database(scan_results: List[Dict]) -> Dict:
@@ -182,41 +295,44 @@ class LocalCheatsScanner:
         games_by_key = {}  # Key: (crc, serial)
         
         for result in scan_results:
-            if not result.get('cheats'):
+            cheats = result.get('cheats')
+            if not cheats:
                 continue
             
+            serial = result.get('serial')
+            crc = result.get('crc')
+            region = LocalCheatsScanner.determine_region(serial)
             key = (result.get('crc', ''), result.get('serial', ''))
+            game = games_by_key.get(key)
             
-            if key not in games_by_key:
+            if game is None:
                 # Create new game entry
-                region = LocalCheatsScanner.determine_region(result.get('serial'))
                 games_by_key[key] = {
                     'title': result.get('game_title', 'Unknown'),
                     'regions': {
                         region: {
-                            'serial': result.get('serial'),
-                            'crc': result.get('crc'),
-                            'cheats': result.get('cheats', [])
+                            'serial': serial,
+                            'crc': crc,
+                            'cheats': cheats
                         }
                     }
                 }
+                continue
+            
+            # MERGE cheats from duplicate files (without deduplication)
+            # Let merge_cheats_databases.py handle deduplication
+            reg = game['regions'].get(region)
+            if reg is None:
+                # New region
+                game['regions'][region] = {
+                    'serial': serial,
+                    'crc': crc,
+                    'cheats': cheats
+                }
             else:
-                # MERGE cheats from duplicate files (without deduplication)
-                # Let merge_cheats_databases.py handle deduplication
-                existing_game = games_by_key[key]
-                region = LocalCheatsScanner.determine_region(result.get('serial'))
-                
-                if region not in existing_game['regions']:
-                    # New region
-                    existing_game['regions'][region] = {
-                        'serial': result.get('serial'),
-                        'crc': result.get('crc'),
-                        'cheats': result.get('cheats', [])
-                    }
-                else:
-                    # Merge ALL cheats (no name-based dedup)
-                    # Preserves all cheat codes from all files
-                    existing_game['regions'][region]['cheats'].extend(result.get('cheats', []))
+                # Merge ALL cheats (no name-based dedup)
+                # Preserves all cheat codes from all files
+                reg['cheats'].extend(cheats)
         
         return {
             'games': list(games_by_key.values()),
@@ -234,13 +350,17 @@ def main():
     parser.add_argument('--folder', default='./PS2 Cheats', help='Path to PS2 cheats folder')
     parser.add_argument('--output', default='local_cheats_database.json', help='Output database JSON path')
     parser.add_argument('--summary', action='store_true', help='Print summary instead of saving database')
+    parser.add_argument('--compact', action='store_true', help='Write the database without indentation')
+    parser.add_argument('--cache', nargs='?', const=DEFAULT_SCAN_CACHE, default=None, metavar='PATH',
+                        help=f'Reuse parse results of unchanged files (default PATH: {DEFAULT_SCAN_CACHE})')
+    parser.add_argument('--workers', type=int, default=None, help='Parser threads (default: auto)')
     
     args = parser.parse_args()
     
     try:
         # Scan folder
         logger.info(f"Scanning {args.folder}...")
-        results = LocalCheatsScanner.scan_folder(args.folder)
+        results = LocalCheatsScanner.scan_folder(args.folder, workers=args.workers, cache_path=args.cache)
         
         logger.info(f"Scanned {len(results)} files")
         
@@ -277,8 +397,8 @@ def main():
             
             os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
             
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(database, f, indent=2, ensure_ascii=False)
+            with open(args.output, 'wb') as f:
+                dump(database, f, compact=args.compact)
             
             logger.info(f"Database saved to {args.output}")
             logger.info(f"Total games in database: {database['total_games']}")
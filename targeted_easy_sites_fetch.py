@@ -1,9 +1,16 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import json
-import time
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from cheat_online import _normalize_code_lines
+try:
+    from selectolax.lexbor import LexborHTMLParser  # optional: C (lexbor) HTML parser
+except ImportError:
+    LexborHTMLParser = None
 
 HEADERS = {'User-Agent': 'PCSX2-Manager/1.0 (+https://example)'}
 SITES = [
@@ -15,6 +22,21 @@ SITES = [
 ]
 SERIALS = ["SLUS-21678", "SCUS-97481", "SLUS-20312", "SLES-53346"]
 
+# one keep-alive session for Bing and all result sites
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=1)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+MAX_WORKERS = 8
+MAX_PAGE_BYTES = 2_000_000  # cheat pages are far smaller; bounds memory and parse time per link
+# at most two requests in flight per site, in place of a fixed sleep between fetches
+SITE_LIMITS = {site: threading.Semaphore(2) for site in SITES}
+# Bing is queried once per (serial, site) and throttles bursts with empty result pages,
+# so its searches stay serial with this spacing
+SEARCH_DELAY = 0.4
+
 HEX = re.compile(r'\b[0-9A-Fa-f]{8}\b')
 
 
@@ -22,60 +44,95 @@ def bing_site_search(site, query, max_links=6):
     q = f'site:{site} {query}'
     url = 'https://www.bing.com/search'
     try:
-        r = requests.get(url, params={'q': q}, headers=HEADERS, timeout=10)
+        r = SESSION.get(url, params={'q': q}, timeout=10)
         if r.status_code != 200:
             return []
-        soup = BeautifulSoup(r.text, 'html.parser')
-        links = [a.get('href') for a in soup.select('li.b_algo h2 a') if a.get('href')]
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(r.text)
+            links = [a.attributes.get('href') for a in tree.css('li.b_algo h2 a')]
+            links = [l for l in links if l]
+        else:
+            soup = BeautifulSoup(r.text, 'html.parser')
+            links = [a.get('href') for a in soup.select('li.b_algo h2 a') if a.get('href')]
         return links[:max_links]
     except Exception:
         return []
 
 
+def _page_texts(html):
+    """Return (pre/code block texts, whole page text) for a page."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        blocks = [n.text() for n in tree.css('pre, code')]
+        tree.strip_tags(['script', 'style'])  # BeautifulSoup leaves these out of get_text
+        return blocks, tree.root.text(separator='\n', strip=True) if tree.root else ''
+    soup = BeautifulSoup(html, 'html.parser')
+    blocks = [b.get_text() for b in soup.find_all(['pre','code'])]
+    return blocks, soup.get_text('\n', strip=True)
+
+
 def extract_codes_from_page(html):
     out = []
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        for b in soup.find_all(['pre','code']):
-            lines = [l.strip() for l in b.get_text().splitlines() if l.strip()]
+        blocks, txt = _page_texts(html)
+        for block in blocks:
+            lines = [l.strip() for l in block.splitlines() if l.strip()]
             out.extend(_normalize_code_lines(lines))
         # fallback: scan body text for hex pairs
-        txt = soup.get_text('\n', strip=True)
-        hexs = HEX.findall(txt)
-        if len(hexs) >= 2:
-            for i in range(0, len(hexs)-1, 2):
-                out.append(f"{hexs[i].upper()} {hexs[i+1].upper()}")
+        # pair up matches as they are found instead of building the full list
+        it = HEX.finditer(txt)
+        for a in it:
+            b = next(it, None)
+            if b is None:
+                break
+            out.append(f"{a.group().upper()} {b.group().upper()}")
+    except Exception:
+        pass
+    # dedupe, keeping first-seen order
+    return list(dict.fromkeys(out))
+
+
+def fetch_one(serial, site, link):
+    """Fetch one search result and return (serial, site, link, codes)."""
+    codes = []
+    try:
+        with SITE_LIMITS[site]:
+            with SESSION.get(link, timeout=10, stream=True) as r:
+                ctype = r.headers.get('Content-Type', '')
+                if r.status_code != 200 or not ctype.startswith('text/html'):
+                    # skip binary/JSON/error bodies without downloading or parsing them
+                    return serial, site, link, codes
+                chunks = []
+                size = 0
+                for chunk in r.iter_content(chunk_size=65536):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_PAGE_BYTES:
+                        break
+                encoding = r.encoding or 'utf-8'
+        html = b''.join(chunks)[:MAX_PAGE_BYTES].decode(encoding, errors='replace')
+        codes = extract_codes_from_page(html)
     except Exception:
+        # skip
         pass
-    # dedupe
-    seen=set(); res=[]
-    for c in out:
-        if c not in seen:
-            seen.add(c); res.append(c)
-    return res
+    return serial, site, link, codes
 
 
 def main():
-    allresults = {}
-    for s in SERIALS:
-        print('\n==', s, '==')
-        allresults[s] = []
-        for site in SITES:
-            print(' site search:', site)
-            links = bing_site_search(site, s)
-            for link in links:
-                try:
-                    r = requests.get(link, headers=HEADERS, timeout=10)
-                    if r.status_code != 200:
-                        continue
-                    codes = extract_codes_from_page(r.text)
-                    if codes:
-                        print('  found on', site, link, 'codes=', len(codes))
-                        allresults[s].append({'site': site, 'link': link, 'codes': codes})
-                    time.sleep(0.4)
-                except Exception as e:
-                    # skip
-                    pass
+    allresults = {s: [] for s in SERIALS}
+    searches = [(s, site) for s in SERIALS for site in SITES]
+    tasks = []
+    for n, (s, site) in enumerate(searches):
+        if n:
+            time.sleep(SEARCH_DELAY)
+        tasks.extend((s, site, link) for link in bing_site_search(site, s))
+    print(f'{len(tasks)} links from {len(searches)} site searches')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # map keeps results in task order, so the output matches the serial loop
+        for s, site, link, codes in pool.map(lambda t: fetch_one(*t), tasks):
+            if codes:
+                print('  found on', site, link, 'codes=', len(codes))
+                allresults[s].append({'site': site, 'link': link, 'codes': codes})
     with open('targeted_fetch_results.json','w',encoding='utf-8') as f:
         json.dump(allresults,f,ensure_ascii=False,indent=2)
     print('\nWrote targeted_fetch_results.json')
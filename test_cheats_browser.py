@@ -1,5 +1,5 @@
-import json
 import os
+from _fastjson import load_path
 
 # Test what the CheatsTabWidget is actually seeing
 db_path = 'ps2_cheats_database_merged.json'
@@ -7,8 +7,7 @@ db_path = 'ps2_cheats_database_merged.json'
 print(f"File exists: {os.path.exists(db_path)}")
 
 if os.path.exists(db_path):
-    with open(db_path) as f:
-        db = json.load(f)
+    db = load_path(db_path)
     
     games = db.get('games', [])
     total_cheats = sum(len(r.get('cheats',[])) for g in games for r in g.get('regions',{}).values())
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
-import json
+from _fastjson import loads
 
-db = json.load(open('ps2_cheats_database_merged.json'))
+with open('ps2_cheats_database_merged.json', 'rb') as f:
+    db = loads(f.read())
 print(f'✓ Database loaded successfully')
 print(f'  Total games: {len(db["games"])}')
 print(f'  Sample game: {db["games"][0]["title"]}')
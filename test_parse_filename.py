@@ -1,7 +1,7 @@
 import re
 
 def parse_filename(filename):
-    name = filename.replace('.pnach', '')
+    name = filename[:-6] if filename.endswith('.pnach') else filename
     print(f"Parsing: {name}")
     
     match = re.match(r'^([0-9A-Fa-f]{8})\s*-\s*(.+?)(?:\s+([A-Z]+(?:-[0-9]+)?))?\s*$', name)
@@ -0,0 +1,169 @@
+import os
+import sys
+import types
+
+import pytest
+
+from tools.run_tests_isolated import is_gui_test  # same heuristic the isolated runner uses
+
+
+# Headless test runs don't need Qt: when none of the test files being run is a GUI test, main.py is
+# imported against light-weight PySide6 stand-ins instead of the real (slow to import) package.
+# Set PCSX2_FULL_GUI_TESTS=1 to always use the real PySide6.
+
+def _test_files(args):
+    for arg in args:
+        path = arg.split('::', 1)[0]
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for fn in files:
+                    if fn.startswith('test_') and fn.endswith('.py'):
+                        yield os.path.join(root, fn)
+        elif path.endswith('.py'):
+            yield path
+
+
+class _StubMeta(type):
+    # Class-level attribute access (Qt.DisplayRole, Qt.AlignmentFlag.AlignLeft, ...) yields more stubs
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _stub_class(name)
+
+    def __or__(cls, other):
+        return cls
+
+    __ror__ = __or__
+
+
+class _Stub(metaclass=_StubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _Stub()
+
+    def __call__(self, *args, **kwargs):
+        return _Stub()
+
+
+def _stub_class(name):
+    return _StubMeta(name, (_Stub,), {})
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        cls = _stub_class(name)
+        setattr(self, name, cls)
+        return cls
+
+
+def _install_pyside6_stub():
+    fake = _StubModule('PySide6')
+    fake.__path__ = []
+    sys.modules['PySide6'] = fake
+    for sub in ('QtWidgets', 'QtCore', 'QtGui', 'QtTest'):
+        mod = _StubModule('PySide6.' + sub)
+        mod.__all__ = []
+        setattr(fake, sub, mod)
+        sys.modules['PySide6.' + sub] = mod
+    sys.modules['PySide6.QtCore'].SIGNAL = lambda *a, **k: None
+
+
+def pytest_configure(config):
+    if 'PySide6' in sys.modules or os.environ.get('PCSX2_FULL_GUI_TESTS'):
+        return
+    args = config.args or [str(config.rootpath)]
+    if any(is_gui_test(p) for p in _test_files(args)):
+        return
+    _install_pyside6_stub()
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    # One QApplication for the whole run; creating one per test repeats Qt's font/plugin setup
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture(autouse=True)
+def _drain_qt_events(request):
+    # Flush events a GUI test left queued so they can't leak into the next one
+    yield
+    if 'qapp' in request.fixturenames:
+        request.getfixturevalue('qapp').processEvents()
+
+
+@pytest.fixture(scope='session')
+def sample_packs(tmp_path_factory):
+    # Read-only source packs shared by the install tests: packA/ and packB/ (3 x 1 KiB images each)
+    # and pack.zip holding packA's images; each test installs into its own tmp_path
+    import zipfile
+    root = tmp_path_factory.mktemp('sample_packs')
+    for name in ('packA', 'packB'):
+        os.makedirs(root / name)
+        for i in range(3):
+            with open(root / name / f"img{i}.png", 'wb') as f:
+                f.write(os.urandom(1024))
+    with zipfile.ZipFile(root / 'pack.zip', 'w') as z:
+        for fn in sorted(os.listdir(root / 'packA')):
+            z.write(root / 'packA' / fn, arcname=fn)
+    return root
+
+
+def _make_sparse_pack(path, files=1, size=64 * 1024):
+    # Pack folder of files with the given logical size, without writing their data (sparse where the
+    # filesystem allows): enough bytes for a copy to be cancelled part way, at no cost to create
+    os.makedirs(path, exist_ok=True)
+    for i in range(files):
+        with open(os.path.join(path, f"img{i}.png"), 'wb') as f:
+            f.truncate(size)
+
+
+@pytest.fixture
+def make_sparse_pack():
+    return _make_sparse_pack
+
+
+def _wait_signal(spy, signal, timeout_ms=5000):
+    # True once spy has recorded signal, waiting up to timeout_ms for it. QSignalSpy.wait() holds the
+    # GIL while it waits, so a Python QThread could never run to emit; QEventLoop.exec() releases it.
+    from PySide6.QtCore import QEventLoop, QTimer
+    if not spy.count():
+        loop = QEventLoop()
+        signal.connect(loop.quit)
+        QTimer.singleShot(timeout_ms, loop.quit)
+        loop.exec()
+    return spy.count() > 0
+
+
+@pytest.fixture
+def wait_signal(qapp):
+    return _wait_signal
+
+
+def _wait_until(predicate, timeout_ms=5000, poll_ms=5):
+    # True once predicate() holds, running the event loop meanwhile (PySide6 has no QTest.qWaitFor).
+    # Returns as soon as it holds instead of sleeping out fixed qWait slices.
+    from PySide6.QtCore import QEventLoop, QTimer
+    if predicate():
+        return True
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.setInterval(poll_ms)
+    poll.timeout.connect(lambda: predicate() and loop.quit())
+    poll.start()
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    poll.stop()
+    return bool(predicate())
+
+
+@pytest.fixture
+def wait_until(qapp):
+    return _wait_until
@@ -0,0 +1,19 @@
+from PySide6.QtCore import Qt
+from main import BulkTableModel
+
+
+def test_bulk_table_model_rows_and_sort():
+    m = BulkTableModel()
+    m.append_files(['b.pnach', 'a.pnach'])
+    assert m.rowCount() == 2 and m.column(4) == ['queued', 'queued']
+    m.set_row(0, ['b.pnach', 'SLUS-20001', 'deadbeef ', 'Beta', 'parsed'])
+    assert m.lookup_keys(0) == ('DEADBEEF', (('SLUS-20001', 'SLUS20001'),))
+    assert 'beta' in m.haystacks()[0] and m.haystacks(3) == ['beta', '']
+    m.sort(0, Qt.AscendingOrder)
+    assert m.column(0) == ['a.pnach', 'b.pnach']
+    assert m.row(1) == ['b.pnach', 'SLUS-20001', 'deadbeef ', 'Beta', 'parsed']
+    assert m.lookup_keys(1)[0] == 'DEADBEEF' and m.haystacks(3) == ['', 'beta']
+    m.clear_details()
+    assert m.column(3) == ['', ''] and m.column(0) == ['a.pnach', 'b.pnach']
+    m.clear()
+    assert m.rowCount() == 0
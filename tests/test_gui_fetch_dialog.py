@@ -1,10 +1,8 @@
-from PySide6.QtWidgets import QApplication, QDialog
+from PySide6.QtWidgets import QDialog
 from main import MainWindow
 
 
-def test_show_fetch_results_headless(monkeypatch):
-    # Ensure a QApplication exists
-    _ = QApplication.instance() or QApplication([])
+def test_show_fetch_results_headless(qapp, monkeypatch):
     mw = MainWindow()
     # Build fake results
     fake = [
@@ -1,23 +1,14 @@
 import os
 import shutil
-import time
 from PySide6.QtWidgets import QApplication, QLabel, QProgressBar
-from PySide6.QtTest import QTest
+from PySide6.QtTest import QSignalSpy
+from PySide6.QtCore import Qt
 import pytest
 
-import sys
-sys.path.insert(0, os.getcwd())
 from main import MainWindow
 
 
-def _ensure_app():
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
-
-
-def test_packinstallworker_signals(tmp_path):
+def test_packinstallworker_signals(wait_signal, tmp_path):
     # create a valid pack and a missing pack to force a failure
     valid = tmp_path / 'pack_valid'
     os.makedirs(valid / 'replacements', exist_ok=True)
@@ -30,28 +21,19 @@ def test_packinstallworker_signals(tmp_path):
 
     worker = TexturesTab.PackInstallWorker(items, str(tmp_path))
 
-    results = {}
-
-    def on_finished(installed, failures):
-        results['installed'] = installed
-        results['failures'] = failures
-
-    worker.finished.connect(on_finished)
+    spy = QSignalSpy(worker.finished)
     worker.start()
 
     # wait for worker to finish (timeout)
-    deadline = time.time() + 5.0
-    while 'installed' not in results and time.time() < deadline:
-        QTest.qWait(50)
-    assert 'installed' in results
-    assert results['installed'] == 1
-    assert isinstance(results['failures'], list)
-    assert len(results['failures']) == 1
+    assert wait_signal(spy, worker.finished)
+    installed, failures = spy.at(0)
+    assert installed == 1
+    assert isinstance(failures, list)
+    assert len(failures) == 1
 
 
 @pytest.mark.flaky(reruns=1)
-def test_dialog_shows_and_updates(tmp_path):
-    app = _ensure_app()
+def test_dialog_shows_and_updates(qapp, wait_until, tmp_path):
     win = MainWindow()
     win.show()
 
@@ -87,8 +69,8 @@ def test_dialog_shows_and_updates(tmp_path):
             break
     assert dlg is not None
 
-    # wait a bit for worker callbacks to update UI
-    QTest.qWait(500)
+    # wait for worker callbacks to update UI
+    wait_until(lambda: any(c.text().startswith('Current:') for c in dlg.findChildren(QLabel)), 5000)
 
     # find a QLabel that starts with 'Current:' and a progress bar
     per_label = None
@@ -107,17 +89,31 @@ def test_dialog_shows_and_updates(tmp_path):
     assert per_bar is not None
 
     # wait for dialog to finish and close (max wait)
-    timeout = time.time() + 5.0
-    closed = False
-    while time.time() < timeout:
-        QTest.qWait(100)
-        if not dlg.isVisible():
-            closed = True
-            break
-    assert closed
+    assert wait_until(lambda: not dlg.isVisible(), 5000)
 
     try:
         shutil.rmtree(base)
         shutil.rmtree(imports_root)
     except Exception:
         pass
+
+
+def test_base_replacements_item_removed_with_sorted_list(qapp, tmp_path, monkeypatch):
+    # base is SERIAL/replacements holding images plus serial pack folders. The list sorts by
+    # title, so the titled base-as-pack row moves as packs are added and must be removed by
+    # item, not by the row it was inserted at.
+    monkeypatch.setattr(MainWindow, '_show_welcome_if_needed', lambda self: None)
+    win = MainWindow()
+    base = tmp_path / 'SLUS-29999' / 'replacements'
+    for sub in ('', 'SLUS-20001', 'SLUS-20002'):
+        os.makedirs(base / sub, exist_ok=True)
+        with open(base / sub / 'img.png', 'wb') as f:
+            f.write(b'A' * 16)
+    win.cheats_tab.mapping['SLUS-29999'] = 'Zeta'
+
+    win.textures_tab.textures_dir.setText(str(base))
+    win.textures_tab.scan_installed_textures()
+
+    lst = win.textures_tab.packs_list
+    paths = sorted(lst.topLevelItem(i).data(0, Qt.UserRole) for i in range(lst.topLevelItemCount()))
+    assert paths == [str(base / 'SLUS-20001'), str(base / 'SLUS-20002')]
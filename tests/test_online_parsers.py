@@ -32,3 +32,22 @@ def test_normalize_code_lines_edge():
     assert '00200004 00000002' in norm
     assert any(l.startswith('patch=1,EE') for l in norm)
 
+
+def test_playwright_extract_codes_separators():
+    from playwright_fetch import extract_codes_from_html
+    html = ('<pre>20123456:00000001\n2012ABCD,0000FFFF\n20aaaaaa = 00000063\n'
+            'patch=1,EE,00100000,word,00000001\nlone 0000ABCD</pre>')
+    assert extract_codes_from_html(html) == [
+        '20123456 00000001', '2012ABCD 0000FFFF', '20AAAAAA 00000063',
+        'patch=1,EE,00100000,word,00000001',
+    ]
+
+
+def test_normalize_code_lines_pairs_and_padding():
+    raw = ['', '  ', '2012abcd\t0000ffff', 'ABC 1', 'Codes: 00200000 00000001 00200004 00000002 00200008',
+           'PATCH=1,EE,00100000,word,00000001', 'not a code']
+    assert _normalize_code_lines(raw) == [
+        '2012ABCD 0000FFFF', '00000ABC 00000001',
+        '00200000 00000001', '00200004 00000002',
+        'PATCH=1,EE,00100000,word,00000001', 'not a code',
+    ]
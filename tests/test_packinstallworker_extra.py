@@ -1,11 +1,8 @@
 import os
-import time
 from PySide6.QtWidgets import QApplication
-from PySide6.QtTest import QTest
+from PySide6.QtTest import QSignalSpy
 import pytest
 
-import sys
-sys.path.insert(0, os.getcwd())
 from main import TexturesTab
 
 
@@ -31,23 +28,18 @@ def test_packinstallworker_start_run_fallback(monkeypatch, tmp_path):
     items = [("Valid", str(valid))]
     worker = TexturesTab.PackInstallWorker(items, str(tmp_path))
 
-    results = {}
-
-    def on_finished(installed, failures):
-        results['installed'] = installed
-        results['failures'] = failures
-
-    worker.finished.connect(on_finished)
+    spy = QSignalSpy(worker.finished)
     # call start which should call run inline because QApplication.instance() was monkeypatched to None
     worker.start()
 
     # since run is inline we should have results immediately
-    assert 'installed' in results
-    assert results['installed'] == 1
-    assert results['failures'] == []
+    assert spy.count() == 1
+    installed, failures = spy.at(0)
+    assert installed == 1
+    assert failures == []
 
 
-def test_packinstallworker_retry_reporting(tmp_path):
+def test_packinstallworker_retry_reporting(wait_signal, tmp_path):
     # Create one valid pack and one missing pack so there will be a failure reported
     valid = tmp_path / 'pack_valid'
     os.makedirs(valid / 'replacements', exist_ok=True)
@@ -59,47 +51,29 @@ def test_packinstallworker_retry_reporting(tmp_path):
 
     worker = TexturesTab.PackInstallWorker(items, str(tmp_path))
 
-    results = {}
-
-    def on_finished(installed, failures):
-        results['installed'] = installed
-        results['failures'] = failures
-
-    worker.finished.connect(on_finished)
+    spy = QSignalSpy(worker.finished)
     worker.start()
 
     # wait for worker to finish (timeout)
-    deadline = time.time() + 5.0
-    while 'installed' not in results and time.time() < deadline:
-        QTest.qWait(50)
-
-    assert 'installed' in results
-    assert results['installed'] == 1
-    assert isinstance(results['failures'], list)
-    assert len(results['failures']) == 1
+    assert wait_signal(spy, worker.finished)
+    installed, failures = spy.at(0)
+    assert installed == 1
+    assert isinstance(failures, list)
+    assert len(failures) == 1
 
     # The failures item should be a tuple-like (display, src, message)
-    f = results['failures'][0]
+    f = failures[0]
     assert len(f) >= 2
     assert f[0] == 'Missing'
     # Re-run PackInstallWorker with the failed items (simulate retry path)
-    retry_items = [(d, s) for (d, s, *rest) in results['failures']]
+    retry_items = [(d, s) for (d, s, *rest) in failures]
     retry_worker = TexturesTab.PackInstallWorker(retry_items, str(tmp_path))
-    rres = {}
-
-    def on_finished2(installed, failures):
-        rres['installed'] = installed
-        rres['failures'] = failures
-
-    retry_worker.finished.connect(on_finished2)
+    rspy = QSignalSpy(retry_worker.finished)
     retry_worker.start()
 
     # wait
-    deadline = time.time() + 5.0
-    while 'installed' not in rres and time.time() < deadline:
-        QTest.qWait(50)
-
-    assert 'installed' in rres
+    assert wait_signal(rspy, retry_worker.finished)
+    installed, failures = rspy.at(0)
     # since retry item was missing, installed should be 0 and failures length 1
-    assert rres['installed'] == 0
-    assert len(rres['failures']) == 1
+    assert installed == 0
+    assert len(failures) == 1
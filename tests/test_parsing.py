@@ -19,3 +19,172 @@ def test_build_pnach_single_patch():
     assert 'gametitle=Test Game' in out
     assert 'patch=1,EE,00200000,extended,00000001' in out
 
+
+def test_bulk_read_text_universal_newlines(tmp_path):
+    from main import _bulk_read_text, _bulk_scan_fields
+    for eol in (b'\n', b'\r\n', b'\r'):
+        p = tmp_path / 'game.pnach'
+        p.write_bytes(eol.join([b'gametitle=Foo Game', b'// SLUS-20001', b'patch=1,EE,00200000,extended,00000001']))
+        text, _ = _bulk_read_text(str(p))
+        assert '\r' not in text
+        title, serials, _ = _bulk_scan_fields(text)
+        assert title == 'Foo Game'
+        assert serials == ['SLUS-20001']
+
+
+def _game(title, region, serial, crc, n_cheats):
+    return {'title': title, 'regions': {region: {'serial': serial, 'crc': crc,
+                                                 'cheats': [{'name': f'c{i}'} for i in range(n_cheats)]}}}
+
+
+def test_merge_databases_edited_merge_output_is_merged_again():
+    from merge_cheats_databases import CheatsDatabase
+    merged, merge_stats = CheatsDatabase.merge_databases_with_stats(
+        [{'games': [_game('Foo', 'PAL', 'SLES-1', 'AAAAAAAA', 1)]},
+         {'games': [_game('foo ', 'PAL', 'sles-1', 'aaaaaaaa', 2)]}])
+    assert len(merged['games']) == 1
+    assert merge_stats == CheatsDatabase.get_statistics(merged)
+    assert merge_stats['total_cheats'] == 2
+
+    # a duplicate appended after merging must not pass through unmerged, nor with stale stats
+    merged['games'].append(_game('FOO', 'PAL', 'SLES-1', 'AAAAAAAA', 3))
+    stats = CheatsDatabase.get_statistics(merged)
+    assert stats['total_games'] == 2 and stats['total_cheats'] == 5
+    again = CheatsDatabase.merge_databases([merged])
+    assert len(again['games']) == 1
+    assert again['games'] is not merged['games']
+    assert CheatsDatabase.get_statistics(again)['total_cheats'] == 3
+
+    # an in-place replacement that keeps the length is reflected too
+    merged['games'][1] = _game('Bar', 'PAL', 'SLES-2', 'BBBBBBBB', 3)
+    assert CheatsDatabase.get_statistics(merged)['total_cheats'] == 5
+
+
+def test_get_game_cheats_with_explicit_index():
+    from merge_cheats_databases import CheatsDatabase
+    db = {'games': [_game('Foo', 'PAL', 'SLES-1', 'AAAAAAAA', 1), _game('Bar', 'NTSC-U', 'SLUS-2', 'BBBBBBBB', 2)]}
+    idx = CheatsDatabase.build_index(db)
+    assert [r['serial'] for r in CheatsDatabase.get_game_cheats(db, 'bar', serial='slus-2', index=idx)] == ['SLUS-2']
+    assert not CheatsDatabase.get_game_cheats(db, 'bar', serial='SLES-1', index=idx)
+
+    # without an index each call sees the current games
+    db['games'][1] = _game('Baz', 'NTSC-U', 'SLUS-3', 'CCCCCCCC', 1)
+    assert not CheatsDatabase.get_game_cheats(db, 'bar')
+    assert CheatsDatabase.get_game_cheats(db, 'baz')
+
+
+def test_save_database_writes_no_private_keys(tmp_path):
+    import json
+    from merge_cheats_databases import CheatsDatabase
+    merged = CheatsDatabase.merge_databases([{'games': [_game('Foo', 'PAL', 'SLES-1', 'AAAAAAAA', 1)]}])
+    assert CheatsDatabase.get_game_cheats(merged, 'foo')
+    out = tmp_path / 'merged.json'
+    CheatsDatabase.save_database(merged, str(out))
+    saved = json.loads(out.read_text(encoding='utf-8'))
+    assert not [k for k in saved if k.startswith('_')]
+    assert saved['games'] == merged['games']
+
+
+def test_scan_folder_lists_symlinked_pnach(tmp_path):
+    import os
+    from scan_local_cheats import LocalCheatsScanner
+    src = tmp_path / 'elsewhere'
+    cheats = tmp_path / 'cheats'
+    os.makedirs(src)
+    os.makedirs(cheats / 'sub')
+    body = 'gametitle={}\n[Inf HP]\npatch=1,EE,00100000,word,00000001\n'
+    (cheats / '0000AAAA - One SLUS-20001.pnach').write_text(body.format('One'))
+    (cheats / 'sub' / '0000BBBB - Two SLUS-20002.pnach').write_text(body.format('Two'))
+    (src / '0000CCCC - Three SLUS-20003.pnach').write_text(body.format('Three'))
+    try:
+        os.symlink(src / '0000CCCC - Three SLUS-20003.pnach', cheats / '0000CCCC - Three SLUS-20003.pnach')
+    except (OSError, NotImplementedError):
+        pytest.skip('symlinks not available')
+
+    results = LocalCheatsScanner.scan_folder(str(cheats), workers=1, cache_path=None)
+    # os.walk order: the folder's own files first, then its subfolders
+    titles = [r['game_title'] for r in results]
+    assert sorted(titles[:2]) == ['One', 'Three'] and titles[2] == 'Two'
+    assert all(r['cheats_count'] == 1 for r in results)
+
+
+def test_scan_folder_cache_is_opt_in_and_versioned(tmp_path, monkeypatch):
+    import json
+    import scan_local_cheats
+    from scan_local_cheats import LocalCheatsScanner
+    cheats = tmp_path / 'cheats'
+    cheats.mkdir()
+    (cheats / '0000AAAA - One SLUS-20001.pnach').write_text('gametitle=One\n[Inf HP]\npatch=1,EE,00100000,word,00000001\n')
+    monkeypatch.chdir(tmp_path)
+
+    fresh = LocalCheatsScanner.scan_folder('cheats', workers=1)
+    assert list(tmp_path.iterdir()) == [cheats]  # no cache written unless asked for
+
+    cache = tmp_path / 'scan_cache.json'
+    assert LocalCheatsScanner.scan_folder('cheats', workers=1, cache_path=str(cache)) == fresh
+    assert json.loads(cache.read_text())['version'] == scan_local_cheats.SCAN_CACHE_VERSION
+
+    # a hit is reported under the path used for this scan
+    hit = LocalCheatsScanner.scan_folder(str(cheats), workers=1, cache_path=str(cache))
+    assert hit[0]['filepath'] == str(cheats / '0000AAAA - One SLUS-20001.pnach')
+    assert {k: v for k, v in hit[0].items() if k != 'filepath'} == {k: v for k, v in fresh[0].items() if k != 'filepath'}
+
+    # results cached by another parser version are not reused
+    monkeypatch.setattr(scan_local_cheats, 'SCAN_CACHE_VERSION', scan_local_cheats.SCAN_CACHE_VERSION + 1)
+    assert LocalCheatsScanner._load_scan_cache(str(cache)) == {}
+
+
+def test_parse_pnach_file_sections_and_codes(tmp_path):
+    from scan_local_cheats import LocalCheatsScanner
+    p = tmp_path / 'ABCD1234 - Foo Game.pnach'
+    p.write_text('gametitle=Foo Game\nserial=slus-20001\n// comment\n'
+                 '[Cheats/Infinite HP]\npatch=1,EE,00200000,extended,00000001\n'
+                 '[Empty]\n[Max Money]\ncode0=20300000 0098967F\n', encoding='utf-8')
+    res = LocalCheatsScanner.parse_pnach_file(str(p))
+    assert res['game_title'] == 'Foo Game'
+    assert res['serial'] == 'SLUS-20001'
+    assert res['crc'] == 'ABCD1234'
+    assert [c['name'] for c in res['cheats']] == ['Infinite HP', 'Max Money']
+    assert res['cheats'][0]['codes'] == ['patch=1,EE,00200000,extended,00000001']
+    assert res['cheats'][1]['codes'] == ['20300000 0098967F']
+    assert res['cheats_count'] == 2
+
+
+def test_pnach_parser_content_and_crc():
+    from fetch_github_cheats import PnachParser
+    content = ('// CRC: deadbeef\ngametitle=Foo Game\nserial=SLUS-20001\n'
+               '[Cheats/Infinite HP]\ncode0=patch=1,EE,00200000,extended,00000001\n'
+               '[Last]\n')
+    res = PnachParser.parse_pnach_content(content)
+    assert res['gametitle'] == 'Foo Game'
+    assert res['serial'] == 'SLUS-20001'
+    assert res['cheats'][0] == {'name': 'Infinite HP', 'codes': ['patch=1,EE,00200000,extended,00000001']}
+    # the last section is kept even without codes
+    assert res['cheats'][1] == {'name': 'Last', 'codes': []}
+    assert PnachParser.extract_crc_from_pnach_content(content) == 'DEADBEEF'
+    assert PnachParser.extract_crc_from_pnach_content('gametitle=Foo\n') is None
+
+
+def test_bulk_scan_fields():
+    from main import _bulk_scan_fields
+    text = ('gametitle=Foo Game SLES_50001 CRC=0A0B0C0D\n'
+            '// also SLUS-20001\n'
+            'gametitle=Other\n')
+    title, serials, crc = _bulk_scan_fields(text)
+    assert title == 'Foo Game SLES_50001 CRC=0A0B0C0D'
+    assert serials == ['SLES-50001', 'SLUS-20001']
+    assert crc == '0A0B0C0D'
+    assert _bulk_scan_fields('nothing here') == ('', [], None)
+
+
+def test_ini_set_bool_keeps_crlf_and_appends(tmp_path):
+    from main import SettingsTab
+    ini = tmp_path / 'PCSX2.ini'
+    ini.write_bytes(b'[EmuCore]\r\nEnableCheats=disabled\r\nOther=1\r\n')
+    assert SettingsTab._ini_set_bool(None, str(ini), 'EnableCheats', True)
+    assert ini.read_bytes() == b'[EmuCore]\r\nEnableCheats=enabled\r\nOther=1\r\n'
+    assert SettingsTab._ini_set_bool(None, str(ini), 'EnablePatches', False)
+    assert ini.read_bytes().endswith(b'Other=1\r\nEnablePatches=disabled\r\n')
+    assert not (tmp_path / 'PCSX2.ini.tmp').exists()
+    assert not SettingsTab._ini_set_bool(None, str(tmp_path / 'missing.ini'), 'EnableCheats', True)
+
@@ -13,14 +13,12 @@ def _create_sample_pack(folder: str, files: int = 3, size: int = 1024):
             f.write(os.urandom(size))
 
 
-def test_perform_pack_installs_success(tmp_path):
+def test_perform_pack_installs_success(tmp_path, sample_packs):
     base = str(tmp_path / 'textures')
     os.makedirs(base, exist_ok=True)
-    # create two packs as folders
-    p1 = str(tmp_path / 'packA')
-    p2 = str(tmp_path / 'packB')
-    _create_sample_pack(p1)
-    _create_sample_pack(p2)
+    # two packs as folders
+    p1 = str(sample_packs / 'packA')
+    p2 = str(sample_packs / 'packB')
     items = [('packA', p1), ('packB', p2)]
     recorded = []
     def prog(c, t, d):
@@ -33,12 +31,12 @@ def test_perform_pack_installs_success(tmp_path):
     assert os.path.isdir(os.path.join(base, 'packB'))
 
 
-def test_perform_pack_installs_cancel(tmp_path):
+def test_perform_pack_installs_cancel(tmp_path, make_sparse_pack):
     base = str(tmp_path / 'textures')
     os.makedirs(base, exist_ok=True)
-    # create one pack with a large file to allow cancellation
+    # create one pack with a file to allow cancellation (content doesn't matter)
     p1 = str(tmp_path / 'packLarge')
-    _create_sample_pack(p1, files=1, size=1024*1024)  # ~1MB
+    make_sparse_pack(p1)
     items = [('packLarge', p1)]
     progress_calls = []
     def prog(c, t, d):
@@ -68,18 +66,10 @@ def test_perform_pack_installs_cancel(tmp_path):
     assert not os.path.exists(dst) or os.path.isdir(dst) == False or installed in (0,1)
 
 
-def test_perform_pack_installs_zip_and_failure(tmp_path):
+def test_perform_pack_installs_zip_and_failure(tmp_path, sample_packs):
     base = str(tmp_path / 'textures')
     os.makedirs(base, exist_ok=True)
-    # create a pack folder and zip it
-    src = str(tmp_path / 'packZip')
-    _create_sample_pack(src)
-    zip_path = os.path.join(str(tmp_path), 'pack.zip')
-    import zipfile
-    with zipfile.ZipFile(zip_path, 'w') as z:
-        for root, _, files in os.walk(src):
-            for f in files:
-                z.write(os.path.join(root, f), arcname=f)
+    zip_path = str(sample_packs / 'pack.zip')
 
     # Create an item that points to a missing path to force failure
     items = [('goodzip', zip_path), ('bad', '/non/existent/path')]
@@ -87,3 +77,95 @@ def test_perform_pack_installs_zip_and_failure(tmp_path):
     # goodzip should be installed, bad should be in failures
     assert installed >= 1
     assert any(f[0] == 'bad' for f in failures)
+
+
+def test_dir_total_size_matches_walk(tmp_path):
+    from textures_install import _dir_total_size
+    for i in range(3):
+        _create_sample_pack(str(tmp_path / f'd{i}' / 'sub'), files=2, size=100 + i)
+    expected = sum(os.path.getsize(os.path.join(r, f)) for r, _, fs in os.walk(tmp_path) for f in fs)
+    assert _dir_total_size(str(tmp_path)) == expected == 606
+    assert _dir_total_size(str(tmp_path / 'missing')) == 0
+
+
+def test_perform_pack_installs_parallel_keeps_order_per_target(tmp_path):
+    base = str(tmp_path / 'textures')
+    os.makedirs(base, exist_ok=True)
+    items = []
+    for name in ('SLUS-20001 old', 'SLES-50001', 'SLUS-20001 new'):
+        src = str(tmp_path / name)
+        _create_sample_pack(src, files=1)
+        with open(os.path.join(src, name + '.png'), 'wb') as f:
+            f.write(b'x')
+        items.append((name, src))
+    items.insert(1, ('missing A', str(tmp_path / 'nope_a')))
+    items.append(('missing B', str(tmp_path / 'nope_b')))
+    calls = []
+    installed, failures = perform_pack_installs(items, base, progress_cb=lambda c, t, d: calls.append((c, t)))
+    assert installed == 3
+    assert [f[0] for f in failures] == ['missing A', 'missing B']
+    assert [c for c, _ in calls] == [1, 2, 3, 4, 5] and all(t == 5 for _, t in calls)
+    # both SLUS-20001 packs go to one folder; the later item wins
+    assert sorted(os.listdir(base)) == ['SLES-50001', 'SLUS-20001']
+    assert os.path.exists(os.path.join(base, 'SLUS-20001', 'SLUS-20001 new.png'))
+    assert not os.path.exists(os.path.join(base, 'SLUS-20001', 'SLUS-20001 old.png'))
+
+
+def test_perform_pack_installs_groups_targets_case_insensitively(tmp_path):
+    import threading
+    base = str(tmp_path / 'textures')
+    os.makedirs(base, exist_ok=True)
+    items = []
+    for name in ('Pack', 'pack'):
+        src = str(tmp_path / 'src' / name)
+        _create_sample_pack(src, files=1)
+        items.append((name, src))
+    threads = []
+    installed, failures = perform_pack_installs(items, base,
+                                                progress_cb=lambda c, t, d: threads.append(threading.get_ident()))
+    assert (installed, failures) == (2, [])
+    # one group, so both run in order on the calling thread
+    assert threads == [threading.get_ident()] * 2
+
+
+def test_perform_pack_installs_zip_streams_replacements(tmp_path):
+    import zipfile
+    base = str(tmp_path / 'textures')
+    os.makedirs(base, exist_ok=True)
+    zip_path = str(tmp_path / 'pack.zip')
+    with zipfile.ZipFile(zip_path, 'w') as z:
+        z.writestr('Pack/readme.txt', 'hi')
+        z.writestr('Pack/replacements/sub/a.png', b'A' * 10)
+        z.writestr('Pack/replacements/../../evil.png', b'E')
+        z.writestr('Pack/replacements/C:/Windows/drive.png', b'D')
+    written = []
+    installed, failures = perform_pack_installs([('SLUS-20001', zip_path)], base,
+                                                file_progress_cb=lambda i, t, d, w, tb: written.append((w, tb)))
+    assert (installed, failures) == (1, [])
+    dst = os.path.join(base, 'SLUS-20001')
+    # the drive prefix is dropped rather than joined onto dst ('C:Windows\\drive.png' on Windows)
+    assert sorted(os.listdir(dst)) == ['Windows', 'evil.png', 'sub']
+    assert os.listdir(os.path.join(dst, 'Windows')) == ['drive.png']
+    with open(os.path.join(dst, 'sub', 'a.png'), 'rb') as f:
+        assert f.read() == b'A' * 10
+    assert written and all(tb == 12 for _, tb in written)
+    assert not os.path.exists(os.path.join(str(tmp_path), 'evil.png'))
+
+
+def test_perform_pack_installs_cancel_keeps_existing_target(tmp_path, sample_packs):
+    base = str(tmp_path / 'textures')
+    _create_sample_pack(os.path.join(base, 'packA'), files=1)
+    before = sorted(os.listdir(os.path.join(base, 'packA')))
+    calls = {'n': 0}
+    def cancel_cb():
+        calls['n'] += 1
+        return calls['n'] > 2
+    installed, failures = perform_pack_installs([('packA', str(sample_packs / 'packA'))], base, cancel_cb=cancel_cb)
+    assert (installed, failures) == (0, [])
+    # the old pack is untouched and no staging folder is left behind
+    assert sorted(os.listdir(os.path.join(base, 'packA'))) == before
+    assert os.listdir(base) == ['packA']
+    installed, failures = perform_pack_installs([('packA', str(sample_packs / 'packA'))], base)
+    assert installed == 1
+    assert sorted(os.listdir(os.path.join(base, 'packA'))) == ['img0.png', 'img1.png', 'img2.png']
+    assert os.listdir(base) == ['packA']
@@ -1,39 +1,5 @@
-import sys
-import types
 import pytest
 
-# Provide light-weight PySide6 stubs so tests can import main.py without GUI deps
-if 'PySide6' not in sys.modules:
-    fake = types.SimpleNamespace()
-    # minimal nested modules used by main.py
-    # Create simple modules with the required names so 'from PySide6.QtWidgets import QApplication, ...' succeeds
-    qw = types.SimpleNamespace()
-    # Define dummy classes/objects referenced in main.py (they won't be instantiated in tests)
-    for name in ['QApplication','QMainWindow','QWidget','QFileDialog','QTabWidget','QVBoxLayout','QHBoxLayout','QFormLayout','QLineEdit','QTextEdit','QPushButton','QLabel','QHeaderView','QMessageBox','QListWidget','QProgressBar','QGroupBox','QComboBox','QCheckBox','QDialog','QListWidgetItem','QAbstractItemView','QRadioButton','QTreeWidget','QTreeWidgetItem','QMenu','QInputDialog']:
-        setattr(qw, name, type(name, (), {}))
-    qc = types.SimpleNamespace()
-    # Provide a Signal callable that accepts args and returns a dummy object
-    class _Signal:
-        def __init__(self, *args, **kwargs):
-            pass
-        def connect(self, *a, **k):
-            pass
-        def emit(self, *a, **k):
-            pass
-    for name in ['Qt','QThread','QSize','QSettings','QTimer']:
-        setattr(qc, name, type(name, (), {}))
-    setattr(qc, 'Signal', _Signal)
-    qg = types.SimpleNamespace()
-    for name in ['QIcon','QPixmap','QDragEnterEvent','QDropEvent','QAction']:
-        setattr(qg, name, type(name, (), {}))
-    fake.QtWidgets = qw
-    fake.QtCore = qc
-    fake.QtGui = qg
-    sys.modules['PySide6'] = fake
-    sys.modules['PySide6.QtWidgets'] = qw
-    sys.modules['PySide6.QtCore'] = qc
-    sys.modules['PySide6.QtGui'] = qg
-
 from main import parse_pnach_text, build_pnach
 
 
@@ -13,14 +13,13 @@ def _make_sample_pack(path: str, files_count=3, file_size=1024):
             f.write(b'A' * file_size)
 
 
-def test_perform_installs_success_and_retry(tmp_path):
+def test_perform_installs_success_and_retry(tmp_path, sample_packs):
     base = tmp_path / 'textures'
     os.makedirs(base, exist_ok=True)
 
-    # Create two sample packs; one will be valid, one will point to non-existent source
-    valid_src = tmp_path / 'pack_valid'
+    # Two sample packs; one is valid, one points to a non-existent source
+    valid_src = sample_packs / 'packA'
     invalid_src = tmp_path / 'pack_missing'
-    _make_sample_pack(str(valid_src))
 
     items = [
         ('Valid Pack', str(valid_src)),
@@ -56,12 +55,12 @@ def test_perform_installs_success_and_retry(tmp_path):
     assert not fails2
 
 
-def test_perform_installs_cancel(tmp_path):
+def test_perform_installs_cancel(tmp_path, make_sparse_pack):
     base = tmp_path / 'textures2'
     os.makedirs(base, exist_ok=True)
 
     src = tmp_path / 'pack_big'
-    _make_sample_pack(str(src), files_count=20, file_size=1024*64)
+    make_sparse_pack(str(src), files=20)
 
     items = [('Big Pack', str(src))]
 
@@ -1,89 +1,309 @@
 import os
+import functools
 import shutil
 import zipfile
 from typing import List, Tuple, Callable, Optional
+import ntpath
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Pure helper functions for installing texture packs without GUI dependencies.
 # These are intentionally free of PySide6 imports so tests can import them headlessly.
 
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+# shortest gap between file progress callbacks (~60 per second)
+_PROGRESS_INTERVAL = 1 / 60
+# most threads decompressing one zip pack
+_ZIP_WORKERS = 8
+_IMAGE_EXTS = frozenset({'png', 'jpg', 'jpeg', 'bmp', 'tga'})
+# Local copy of the serial pattern so worker threads don't need to import the GUI module
+_WIN_ILLEGAL = str.maketrans(':<>|"?*', '_______')
+_SERIAL_RE = re.compile(r"\b(SCUS|SLUS|SLES|SCES|SLPS|SLPM|SCPS|SCAJ|SLKA|ULUS|UCUS|PBPX|PAPX|TCUS|TCES)[-_ ]?\d{3,6}\b", re.IGNORECASE)
+
+
+def _is_image_name(name: str) -> bool:
+    _, dot, ext = name.rpartition('.')
+    return bool(dot) and ext.lower() in _IMAGE_EXTS
+
+
 def _folder_contains_images(folder: str) -> bool:
-    exts = ('.png', '.jpg', '.jpeg', '.bmp', '.tga')
-    try:
-        for _, _, files in os.walk(folder):
-            for f in files:
-                if f.lower().endswith(exts):
-                    return True
-    except Exception:
-        return False
+    # Stops at the first folder (in walk order) holding an image file
+    for _, _, files in _scan_tree(folder):
+        if any(_is_image_name(f.name) for f in files):
+            return True
     return False
 
 
 def _find_replacements(root: str) -> Optional[str]:
-    # Prefer an explicit 'replacements' child that contains images
-    try:
-        for p, dirs, files in os.walk(root):
-            if 'replacements' in dirs:
-                cand = os.path.join(p, 'replacements')
-                if _folder_contains_images(cand):
-                    return cand
-        # fallback: return first folder that contains images
-        for p, dirs, files in os.walk(root):
-            if _folder_contains_images(p):
-                return p
-    except Exception:
-        return None
-    return None
+    # One walk of root: the first 'replacements' child (in walk order) that contains images wins;
+    # otherwise root itself when any image sits anywhere under it
+    has_images = False
+    for _, dirs, files in _scan_tree(root):
+        for d in dirs:
+            if d.name == 'replacements' and _folder_contains_images(d.path):
+                return d.path
+        if not has_images:
+            has_images = any(_is_image_name(f.name) for f in files)
+    return root if has_images else None
+
+
+def _scan_tree(root: str):
+    """
+    Top-down walk of root yielding (dirpath, dir_entries, file_entries) like os.walk, but with the
+    DirEntry objects so callers can reuse their type/stat info. Symlinked folders are listed but not
+    descended into, and folders that can't be read are skipped, both as os.walk does.
+    """
+    stack = [root]
+    while stack:
+        top = stack.pop()
+        dirs, files = [], []
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry)
+        except OSError:
+            continue
+        yield top, dirs, files
+        stack.extend(d.path for d in reversed(dirs) if not d.is_symlink())
+
+
+def _dir_total_size(root: str) -> int:
+    # Sum of file sizes under root; files that can't be stat'ed count as 0
+    total = 0
+    for _, _, files in _scan_tree(root):
+        for entry in files:
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+    return total
 
 
-def _stream_copy_file(src: str, dst: str, cancel_cb: Callable[[], bool], file_progress_cb: Optional[Callable[[int,int], None]] = None, chunk_size: int = 16*1024):
-    # Copy a file in chunks and check cancel callback between chunks
-    os.makedirs(os.path.dirname(dst), exist_ok=True)
+def _stream_copy_file(src: str, dst: str, cancel_cb: Callable[[], bool], file_progress_cb: Optional[Callable[[int,int], None]] = None, chunk_size: int = 1 << 20):
+    # Copy a file in chunks and check cancel callback between chunks. Only a full chunk can have more
+    # data after it, so a file that fits in one chunk is never polled here (callers check per file).
+    # The caller creates dst's folder (shutil.copytree makes each folder before copying into it).
     total = 0
     try:
         total = os.path.getsize(src)
     except Exception:
         total = 0
     written = 0
+    reported = 0
+    last = 0.0
+
+    def _report(final=False):
+        # at most _PROGRESS_INTERVAL apart, plus the final count; each call may become a Qt signal
+        nonlocal reported, last
+        if not file_progress_cb or reported == written:
+            return
+        now = time.monotonic()
+        if not final and now - last < _PROGRESS_INTERVAL:
+            return
+        reported, last = written, now
+        try:
+            file_progress_cb(written, total)
+        except Exception:
+            pass
+
     with open(src, 'rb') as inf, open(dst, 'wb') as outf:
-        while True:
-            if cancel_cb():
-                raise InterruptedError('Cancelled')
-            chunk = inf.read(chunk_size)
-            if not chunk:
-                break
-            outf.write(chunk)
-            written += len(chunk)
-            if file_progress_cb:
-                try:
-                    file_progress_cb(written, total)
-                except Exception:
-                    pass
+        if _HAS_SENDFILE:
+            # kernel-side copy; where sendfile can't write to a file (e.g. macOS) the first call fails
+            # before anything is copied and the buffered loop below takes over
+            in_fd, out_fd = inf.fileno(), outf.fileno()
+            try:
+                while True:
+                    sent = os.sendfile(out_fd, in_fd, None, chunk_size)
+                    if not sent:
+                        break
+                    written += sent
+                    _report()
+                    if sent == chunk_size and cancel_cb():
+                        raise InterruptedError('Cancelled')
+            except InterruptedError:
+                raise
+            except OSError:
+                if written:
+                    raise
+        if not written:
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while True:
+                n = inf.readinto(buf)
+                if not n:
+                    break
+                outf.write(view[:n])
+                written += n
+                _report()
+                if n == chunk_size and cancel_cb():
+                    raise InterruptedError('Cancelled')
+        _report(final=True)
     try:
         shutil.copystat(src, dst)
     except Exception:
         pass
 
 
-def _copytree_stream(src: str, dst: str, cancel_cb: Callable[[], bool], file_progress_cb: Optional[Callable[[int,int], None]] = None):
-    # Recursively copy directory src -> dst using streaming file copies to allow interruption
+class _Cancelled(Exception):
+    # Not an OSError, so shutil.copytree lets it out at once instead of collecting it per file
+    pass
+
+
+def _copy_with_cancel(src: str, dst: str, *, cancel_cb: Callable[[], bool], file_progress_cb: Optional[Callable[[int,int], None]] = None):
+    # copy_function for shutil.copytree: stream one file, checking cancel before it starts
+    try:
+        if cancel_cb():
+            raise InterruptedError('Cancelled')
+        _stream_copy_file(src, dst, cancel_cb, file_progress_cb=file_progress_cb)
+    except InterruptedError:
+        raise _Cancelled()
+
+
+def _ignore_symlinked_dirs(folder: str, names: List[str]) -> List[str]:
+    # shutil.copytree ignore hook: symlinked folders are not descended into, as with os.walk
+    return [n for n in names if os.path.islink(os.path.join(folder, n)) and os.path.isdir(os.path.join(folder, n))]
+
+
+def _zip_chosen_prefix(names: List[str]) -> str:
+    """
+    The folder prefix ('' or 'a/b/') of a zip's members to install, chosen the way an unpacked
+    folder is: within 'replacements/' when the zip has one at its top, the first 'replacements'
+    folder holding images, else that top folder itself.
+    """
+    dirs = set()
+    files = []
+    for n in names:
+        if not n.endswith('/'):
+            files.append(n)
+        parts = n.split('/')[:-1]
+        for k in range(1, len(parts) + 1):
+            dirs.add('/'.join(parts[:k]) + '/')
+    root = 'replacements/' if 'replacements/' in dirs else ''
+    # nested 'replacements' folders, parents in walk order
+    cands = sorted((d for d in dirs if d.startswith(root) and d.endswith('/replacements/')),
+                   key=lambda d: d.split('/')[:-2])
+    for d in cands:
+        if any(f.startswith(d) and _is_image_name(f) for f in files):
+            return d
+    return root
+
+
+def _zip_member_parts(name: str) -> List[str]:
+    # Path parts a zip member may be written under, cleaned as ZipFile.extractall does: drive prefixes,
+    # empty, '.' and '..' parts are dropped and, on Windows, characters Windows rejects become '_'.
+    # Drives are stripped on every platform; packs are mostly made on Windows, where 'C:/x.png'
+    # would otherwise be joined as 'C:x.png', outside the target folder.
+    name = name.replace('/', os.sep)
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+    name = ntpath.splitdrive(name)[1]
+    parts = [p for p in name.split(os.sep) if p not in ('', os.curdir, os.pardir)]
+    if os.sep == '\\':
+        parts = [p.translate(_WIN_ILLEGAL).rstrip('.') for p in parts]
+        parts = [p for p in parts if p]
+    return parts
+
+
+def _extract_zip_stream(zf: zipfile.ZipFile, members: List[zipfile.ZipInfo], prefix: str, dst: str, cancel_cb: Callable[[], bool], file_progress_cb: Optional[Callable[[int,int], None]] = None, chunk_size: int = 1 << 20):
+    # Write the given members of zf (paths relative to prefix) into dst, checking cancel between chunks.
+    # Member paths are cleaned by _zip_member_parts, so nothing is written outside dst.
+    # Members are decompressed on a few threads (zlib releases the GIL), each reading through its own
+    # handle on the zip since one ZipFile can't be read from several threads at once.
     if os.path.exists(dst):
         raise FileExistsError(dst)
-    for root, dirs, files in os.walk(src):
-        rel = os.path.relpath(root, src)
-        target_root = os.path.join(dst, rel) if rel != '.' else dst
-        os.makedirs(target_root, exist_ok=True)
-        for d in dirs:
-            try:
-                os.makedirs(os.path.join(target_root, d), exist_ok=True)
-            except Exception:
-                pass
-        for f in files:
-            s = os.path.join(root, f)
-            t = os.path.join(target_root, f)
-            if cancel_cb():
-                raise InterruptedError('Cancelled')
-            _stream_copy_file(s, t, cancel_cb, file_progress_cb=file_progress_cb)
+    os.makedirs(dst)
+    made = {dst}  # folders known to exist, so each is created once rather than per member
+    files = []
+    for info in members:
+        parts = _zip_member_parts(info.filename[len(prefix):])
+        if not parts:
+            continue
+        target = os.path.join(dst, *parts)
+        folder = target if info.is_dir() else os.path.dirname(target)
+        if folder not in made:
+            os.makedirs(folder, exist_ok=True)
+            made.add(folder)
+        if not info.is_dir():
+            files.append((info, target))
+
+    workers = min(_ZIP_WORKERS, os.cpu_count() or 2, len(files))
+    local = threading.local()
+    handles = []
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def _handle() -> zipfile.ZipFile:
+        if workers <= 1:
+            return zf
+        h = getattr(local, 'zf', None)
+        if h is None:
+            h = local.zf = zipfile.ZipFile(zf.filename, 'r')
+            with lock:
+                handles.append(h)
+        return h
+
+    def _extract(info: zipfile.ZipInfo, target: str):
+        if stop.is_set() or cancel_cb():
+            raise InterruptedError('Cancelled')
+        written = 0
+        last = 0.0
+        with _handle().open(info) as inf, open(target, 'wb') as outf:
+            while True:
+                chunk = inf.read(chunk_size)
+                full = len(chunk) == chunk_size
+                if chunk:
+                    outf.write(chunk)
+                    written += len(chunk)
+                now = time.monotonic()
+                # throttled like _stream_copy_file; a short read is the member's last chunk
+                if file_progress_cb and written and (not full or now - last >= _PROGRESS_INTERVAL):
+                    last = now
+                    try:
+                        with lock:
+                            file_progress_cb(written, info.file_size)
+                    except Exception:
+                        pass
+                if not full:
+                    break
+                if stop.is_set() or cancel_cb():
+                    raise InterruptedError('Cancelled')
+
+    try:
+        if workers <= 1:
+            for info, target in files:
+                _extract(info, target)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = [ex.submit(_extract, info, target) for info, target in files]
+                try:
+                    for fut in futs:
+                        fut.result()
+                except BaseException:
+                    # let the running members stop at their next chunk and drop the queued ones
+                    stop.set()
+                    for fut in futs:
+                        fut.cancel()
+                    raise
+    finally:
+        for h in handles:
+            h.close()
+
+
+def _target_name(display: str, target_hint: str = '') -> str:
+    # Folder name a pack installs to: the hint, else a serial in the display name, else the display name.
+    # '' when only the chosen source folder can name it.
+    if target_hint:
+        target_name = target_hint
+    else:
+        m = _SERIAL_RE.search(display or '')
+        target_name = m.group(0).upper() if m else os.path.basename(display)
+    return os.path.basename(target_name)
 
 
 def perform_pack_installs(
@@ -103,112 +323,124 @@ def perform_pack_installs(
     total = len(items)
     cancel_cb = cancel_cb or (lambda: False)
     progress_cb = progress_cb or (lambda c, t, d: None)
+    # kept as None when not given: pack sizes are only worked out for a progress sink
+    _file_progress_cb = file_progress_cb
     file_progress_cb = file_progress_cb or (lambda idx, total_items, display, written, total_bytes: None)
+    # packs may install on several threads; callbacks and totals are serialized through this
+    lock = threading.Lock()
 
     def _install_one(idx: int, display: str, src: str) -> Tuple[int, Optional[Tuple[str, str, str]]]:
-        temp_dir = None
         try:
             if not os.path.exists(src):
                 return 0, (display, src, 'Source path not found')
 
-            # unzip if needed
-            if os.path.isfile(src) and src.lower().endswith('.zip'):
-                temp_dir = os.path.join(os.path.expanduser('~'), '.pcsx2_manager_tmp', f"unzip_{idx}")
-                if os.path.exists(temp_dir):
-                    try:
-                        shutil.rmtree(temp_dir)
-                    except Exception:
-                        pass
-                os.makedirs(temp_dir, exist_ok=True)
-                with zipfile.ZipFile(src, 'r') as z:
-                    z.extractall(temp_dir)
-                src_folder = temp_dir
-            else:
-                src_folder = src
-
-            repl = os.path.join(src_folder, 'replacements')
-            if os.path.isdir(repl):
-                chosen = _find_replacements(repl) or repl
-            else:
-                chosen = _find_replacements(src_folder) or src_folder
-
-            if not chosen:
-                return 0, None
-
-            # infer dst name
-            serial_candidate = None
+            # zips are read member by member straight into the target, without unpacking to a temp folder
+            zf = zipfile.ZipFile(src, 'r') if os.path.isfile(src) and src.lower().endswith('.zip') else None
             try:
-                # Use a local SERIAL_RE to avoid importing the GUI module from a worker thread
-                SERIAL_RE = re.compile(r"\b(SCUS|SLUS|SLES|SCES|SLPS|SLPM|SCPS|SCAJ|SLKA|ULUS|UCUS|PBPX|PAPX|TCUS|TCES)[-_ ]?\d{3,6}\b", re.IGNORECASE)
-                m = SERIAL_RE.search(display or '')
-                if m:
-                    serial_candidate = m.group(0).upper()
-            except Exception:
-                serial_candidate = None
-
-            if target_hint:
-                target_name = target_hint
-            elif serial_candidate:
-                target_name = serial_candidate
-            else:
-                target_name = os.path.basename(display) or os.path.basename(chosen)
-            target_name = os.path.basename(target_name)
-            dst = os.path.join(base, target_name)
-
-            if os.path.exists(dst):
-                try:
-                    shutil.rmtree(dst)
-                except Exception as e:
-                    return 0, (display, src, f"Unable to remove existing target: {e}")
-
-            # compute total bytes for this pack
-            total_bytes = 0
-            for r, _, fs in os.walk(chosen):
-                for fn in fs:
-                    try:
-                        total_bytes += os.path.getsize(os.path.join(r, fn))
-                    except Exception:
-                        pass
+                if zf is not None:
+                    infos = zf.infolist()
+                    prefix = _zip_chosen_prefix([i.filename for i in infos])
+                    members = [i for i in infos if i.filename.startswith(prefix) and i.filename != prefix]
+                    source_name = os.path.basename(prefix.rstrip('/')) or os.path.splitext(os.path.basename(src))[0]
+                else:
+                    repl = os.path.join(src, 'replacements')
+                    if os.path.isdir(repl):
+                        chosen = _find_replacements(repl) or repl
+                    else:
+                        chosen = _find_replacements(src) or src
+                    source_name = os.path.basename(chosen)
 
-            # create file progress callback bound to this item
-            def make_file_progress(i, t_items, disp, tb):
-                def _file_progress(written, _file_total):
-                    if cancel_cb():
-                        return
-                    try:
-                        file_progress_cb(i, t_items, disp, written, tb)
-                    except Exception:
-                        pass
+                target_name = _target_name(display, target_hint) or source_name
+                dst = os.path.join(base, target_name)
+                # copied next to dst and renamed into place once complete, so an existing pack stays
+                # untouched until then and a failed or cancelled copy never shows up under dst
+                staging = f"{dst}.part.{os.getpid()}"
+                if os.path.exists(staging):
+                    shutil.rmtree(staging, ignore_errors=True)
 
-                return _file_progress
+                # compute total bytes for this pack
+                if _file_progress_cb is None:
+                    total_bytes = 0
+                elif zf is not None:
+                    total_bytes = sum(i.file_size for i in members if not i.is_dir())
+                else:
+                    total_bytes = _dir_total_size(chosen)
+
+                # create file progress callback bound to this item
+                def make_file_progress(i, t_items, disp, tb):
+                    if _file_progress_cb is None:
+                        return None
+
+                    def _file_progress(written, _file_total):
+                        if cancel_cb():
+                            return
+                        try:
+                            with lock:
+                                file_progress_cb(i, t_items, disp, written, tb)
+                        except Exception:
+                            pass
+
+                    return _file_progress
 
-            try:
-                _copytree_stream(chosen, dst, cancel_cb, file_progress_cb=make_file_progress(idx, total, display, total_bytes))
-            except InterruptedError:
                 try:
+                    if zf is not None:
+                        _extract_zip_stream(zf, members, prefix, staging, cancel_cb, file_progress_cb=make_file_progress(idx, total, display, total_bytes))
+                    else:
+                        shutil.copytree(chosen, staging, ignore=_ignore_symlinked_dirs,
+                                        copy_function=functools.partial(_copy_with_cancel, cancel_cb=cancel_cb, file_progress_cb=make_file_progress(idx, total, display, total_bytes)))
                     if os.path.exists(dst):
-                        shutil.rmtree(dst)
+                        try:
+                            shutil.rmtree(dst)
+                        except Exception as e:
+                            shutil.rmtree(staging, ignore_errors=True)
+                            return 0, (display, src, f"Unable to remove existing target: {e}")
+                    os.replace(staging, dst)
+                except (InterruptedError, _Cancelled):
+                    shutil.rmtree(staging, ignore_errors=True)
+                    return 0, None
                 except Exception:
-                    pass
-                return 0, None
-            return 1, None
+                    shutil.rmtree(staging, ignore_errors=True)
+                    raise
+                return 1, None
+            finally:
+                if zf is not None:
+                    zf.close()
         except Exception as e:
             return 0, (display, src, str(e))
-        finally:
-            try:
-                if temp_dir and os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-            except Exception:
-                pass
 
+    # Packs bound for the same folder install one after another in item order, so the last one still
+    # wins; packs bound for different folders install in parallel. If any pack can only be named from
+    # its source folder, destinations aren't known up front and everything runs in order.
+    # Names are compared case-insensitively, as 'Pack' and 'pack' are one folder on Windows and macOS.
+    groups = {}
     for idx, (display, src) in enumerate(items, start=1):
-        if cancel_cb():
-            break
-        cnt, fail = _install_one(idx, display, src)
-        installed += cnt
-        if fail:
-            failures.append(fail)
-        progress_cb(idx, total, display)
+        groups.setdefault(os.path.normcase(_target_name(display, target_hint)).casefold(), []).append((idx, display, src))
+    if '' in groups:
+        groups = {'': [(idx, display, src) for idx, (display, src) in enumerate(items, start=1)]}
 
-    return installed, failures
+    done = 0
+    indexed_failures: List[Tuple[int, Tuple[str, str, str]]] = []
+
+    def _run_group(group):
+        nonlocal installed, done
+        for idx, display, src in group:
+            if cancel_cb():
+                return
+            cnt, fail = _install_one(idx, display, src)
+            with lock:
+                installed += cnt
+                if fail:
+                    indexed_failures.append((idx, fail))
+                done += 1
+                progress_cb(done, total, display)
 
+    group_list = list(groups.values())
+    if len(group_list) == 1:
+        _run_group(group_list[0])
+    elif group_list:
+        with ThreadPoolExecutor(max_workers=min(len(group_list), os.cpu_count() or 4)) as ex:
+            for fut in [ex.submit(_run_group, g) for g in group_list]:
+                fut.result()
+
+    failures.extend(fail for _, fail in sorted(indexed_failures, key=lambda x: x[0]))
+    return installed, failures
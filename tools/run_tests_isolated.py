@@ -3,46 +3,90 @@
 
 Behavior:
  - Collect all tests via pytest collection.
- - Run non-GUI tests in-process.
+ - Run non-GUI tests in one pytest subprocess (sharded across processes when pytest-xdist is installed).
  - Run each GUI test (heuristic: file name contains 'gui' or source contains 'QApplication') in its own subprocess
-   with QT_QPA_PLATFORM=offscreen and capture output.
+   with QT_QPA_PLATFORM=offscreen and capture output. With pytest-forked (POSIX only) this is a single pytest run
+   forking per test; otherwise one pytest subprocess per test.
  - Aggregate stdout/stderr into test_log.txt and return non-zero if any test failed.
 """
+import functools
 import os
 import sys
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 import pytest
 
 
+@functools.lru_cache(maxsize=None)
 def is_gui_test(path):
+    # cached: called once per nodeid, but a file holds many tests
     if 'gui' in os.path.basename(path).lower():
         return True
     try:
-        src = open(path, 'r', encoding='utf-8', errors='ignore').read()
-        if 'QApplication' in src or 'QtTest' in src:
-            return True
-    except Exception:
-        pass
-    return False
+        # the Qt imports that give a GUI test away sit at the top of the file; plain ASCII, so no decoding
+        with open(path, 'rb') as f:
+            data = f.read(65536)
+    except OSError:
+        return False
+    return b'QApplication' in data or b'QtTest' in data
+
+
+class _Collector:
+    """pytest plugin that records (file path, nodeid) for every collected test."""
+
+    def __init__(self):
+        self.items = []
+
+    def pytest_collection_modifyitems(self, items):
+        self.items = [(str(item.path), item.nodeid) for item in items]
 
 
 def collect_tests():
-    # Use pytest's --collect-only via subprocess to list nodeids
-    res = subprocess.run([sys.executable, '-m', 'pytest', '--collect-only', '-q'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    out = res.stdout.decode('utf-8', errors='replace')
-    # Only lines containing '::' are test nodeids; ignore warnings/other lines
-    nodeids = [line.strip() for line in out.splitlines() if line.strip() and '::' in line]
-    return nodeids
+    # Collect in this process instead of paying for a second pytest start-up just to list nodeids
+    collector = _Collector()
+    # no cache plugin and no header/summary: only the nodeids are wanted from this run
+    pytest.main(['--collect-only', '-qq', '-p', 'no:cacheprovider', '--no-header', '--no-summary'],
+                plugins=[collector])
+    return collector.items
+
+
+def _stream(cmd, env, logf, flush_every=1.0):
+    """Run cmd, copying its combined stdout/stderr into logf line by line; return the exit code.
+
+    logf is flushed at most every flush_every seconds, so a hanging test's last output is on disk.
+    """
+    p = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                         bufsize=1, text=True, encoding='utf-8', errors='replace')
+    last_flush = time.monotonic()
+    with p.stdout:
+        for line in p.stdout:
+            logf.write(line)
+            now = time.monotonic()
+            if now - last_flush >= flush_every:
+                logf.flush()
+                last_flush = now
+    logf.flush()
+    return p.wait()
+
+
+def _gui_env():
+    env = os.environ.copy()
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def _run_gui(nodeid):
+    cmd = [sys.executable, '-m', 'pytest', '-q', nodeid]
+    return nodeid, subprocess.run(cmd, env=_gui_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
 
 
 def main():
-    nodeids = collect_tests()
     gui = []
     non_gui = []
-    for n in nodeids:
-        # nodeid format: path::testname
-        path = n.split('::', 1)[0]
+    for path, n in collect_tests():
         if is_gui_test(path):
             gui.append(n)
         else:
@@ -50,31 +94,44 @@ def main():
 
     log_path = os.path.join(os.getcwd(), 'test_log.txt')
     failed = False
-    with open(log_path, 'w', encoding='utf-8', errors='replace') as logf:
+    # 1 MiB buffer: the banners and pytest output go out in a few large writes
+    with open(log_path, 'w', encoding='utf-8', errors='replace', buffering=1 << 20) as logf:
         if non_gui:
             logf.write('Running non-GUI tests (subprocess)\n')
             # Run non-GUI nodeids via subprocess so we capture stdout/stderr
-            cmd = [sys.executable, '-m', 'pytest', '-q'] + non_gui
-            p = subprocess.run(cmd, env=os.environ.copy(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            out = p.stdout.decode('utf-8', errors='replace')
-            logf.write(out)
-            logf.write(f'Non-GUI pytest exit: {p.returncode}\n')
-            if p.returncode != 0:
+            cmd = [sys.executable, '-m', 'pytest', '-q']
+            if find_spec('xdist') is not None:
+                # shard across worker processes (whole files per worker), leaving two cores free
+                cmd += ['-n', str(max(1, (os.cpu_count() or 1) - 2)), '--dist=loadfile']
+            cmd += non_gui
+            code = _stream(cmd, os.environ.copy(), logf)
+            logf.write(f'Non-GUI pytest exit: {code}\n')
+            logf.flush()  # keep the non-GUI results on disk if a GUI run takes the runner down
+            if code != 0:
                 failed = True
 
-        if gui:
+        if gui and hasattr(os, 'fork') and find_spec('pytest_forked') is not None:
+            # one pytest run (one startup + collection) that forks a fresh process per test
+            logf.write('\nRunning GUI tests in forked subprocesses\n')
+            cmd = [sys.executable, '-m', 'pytest', '-q', '--forked'] + gui
+            logf.write(f'\n--- GUI TESTS ({len(gui)}, forked) ---\n')
+            code = _stream(cmd, _gui_env(), logf)
+            logf.write('\n--- END ---\n')
+            if code != 0:
+                failed = True
+        elif gui:
             logf.write('\nRunning GUI tests in subprocesses\n')
-            for nodeid in gui:
-                env = os.environ.copy()
-                env.setdefault('QT_QPA_PLATFORM', 'offscreen')
-                cmd = [sys.executable, '-m', 'pytest', '-q', nodeid]
-                p = subprocess.run(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                out = p.stdout.decode('utf-8', errors='replace')
-                logf.write('\n--- GUI TEST: ' + nodeid + ' ---\n')
-                logf.write(out)
-                logf.write('\n--- END ---\n')
-                if p.returncode != 0:
-                    failed = True
+            # each test still gets its own process; the subprocesses just run side by side, so their output is
+            # captured whole (not streamed) to keep each test's block contiguous in the log
+            workers = max(1, min(len(gui), (os.cpu_count() or 1) - 2))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                for nodeid, p in ex.map(_run_gui, gui):
+                    out = p.stdout.decode('utf-8', errors='replace')
+                    logf.write('\n--- GUI TEST: ' + nodeid + ' ---\n')
+                    logf.write(out)
+                    logf.write('\n--- END ---\n')
+                    if p.returncode != 0:
+                        failed = True
 
     print('\nTest run complete. Log saved to', log_path)
     return 1 if failed else 0
@@ -1,8 +1,74 @@
 import os
-import json
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _fastjson import loads
+
+try:
+    import ijson  # optional: streams the merged database's games instead of loading the whole file
+except ImportError:
+    ijson = None
+
+# CRC_HEX - Title SERIAL (file name without the .pnach extension)
+_NAME_RE = re.compile(r'^([0-9A-Fa-f]{8})\s*-\s*(.+?)(?:\s+([A-Z]+(?:-[0-9]+)?))?$')
+
+
+def iter_pnach(path):
+    """Yield paths of .pnach files under path, in os.walk order, using scandir's cached entry types."""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith('.pnach') and entry.is_file():
+                yield entry.path
+        except OSError:
+            continue
+    for sub in subdirs:
+        yield from iter_pnach(sub)
+
+
+def scan_file(filepath):
+    """
+    Return (crc, title, serial, cheat_count) for a .pnach file, None if it has no codes,
+    or the OSError raised while reading it.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return e
+    
+    # Count patch= lines (each one is a code); a plain byte count, no decoding needed
+    cheat_count = data.count(b'\npatch=') + data.startswith(b'patch=')
+    if not cheat_count:
+        return None
+    
+    # Extract info from filename
+    stem = os.path.basename(filepath)[:-len('.pnach')]
+    
+    # Try to parse: CRC_HEX - Title SERIAL.pnach
+    match = _NAME_RE.match(stem)
+    
+    if match:
+        crc = match.group(1)
+        title = match.group(2).strip()
+        serial = match.group(3) if match.group(3) else "?"
+    else:
+        crc = "?"
+        title = stem
+        serial = "?"
+    
+    return crc, title, serial, cheat_count
+
+
 print("=" * 80)
 print("SCANNING LOCAL PS2 CHEATS FOLDER")
 print("=" * 80)
@@ -13,53 +79,34 @@ cheats_folder = "./PS2 Cheats"
 total_files = 0
 files_with_cheats = 0
 total_cheats_found = 0
-games_dict = {}  # Track unique games by (serial, crc, title)
-
-for root, dirs, files in os.walk(cheats_folder):
-    for file in files:
-        if file.endswith('.pnach'):
-            total_files += 1
-            filepath = os.path.join(root, file)
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Count patch= lines (each one is a code)
-                cheat_count = len(re.findall(r'^patch=', content, re.MULTILINE))
-                
-                if cheat_count > 0:
-                    files_with_cheats += 1
-                    total_cheats_found += cheat_count
-                    
-                    # Extract info from filename
-                    filename = os.path.basename(filepath)
-                    
-                    # Try to parse: CRC_HEX - Title SERIAL.pnach
-                    match = re.match(r'^([0-9A-Fa-f]{8})\s*-\s*(.+?)(?:\s+([A-Z]+(?:-[0-9]+)?))?\.pnach$', filename.replace('.pnach', ''))
-                    
-                    if match:
-                        crc = match.group(1)
-                        title = match.group(2).strip()
-                        serial = match.group(3) if match.group(3) else "?"
-                    else:
-                        crc = "?"
-                        title = filename.replace('.pnach', '')
-                        serial = "?"
-                    
-                    key = (serial, crc, title)
-                    if key not in games_dict:
-                        games_dict[key] = 0
-                    games_dict[key] += cheat_count
-                    
-            except Exception as e:
-                pass
+games_dict = defaultdict(int)  # Track unique games by (serial, crc, title)
+errors = []  # (path, OSError) for files that could not be read
+
+paths = list(iter_pnach(cheats_folder))
+total_files = len(paths)
+
+# Thousands of small independent files: read and count them on a thread pool
+# (map keeps results in file order)
+with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+    for filepath, res in zip(paths, ex.map(scan_file, paths)):
+        if res is None:
+            continue
+        if isinstance(res, OSError):
+            errors.append((filepath, res))
+            continue
+        crc, title, serial, cheat_count = res
+        files_with_cheats += 1
+        total_cheats_found += cheat_count
+        
+        games_dict[(serial, crc, title)] += cheat_count
 
 print(f"\n📊 STATISTICS:")
 print(f"  Total .pnach files:        {total_files:,}")
 print(f"  Files with cheats:         {files_with_cheats:,}")
 print(f"  Total cheat patches:       {total_cheats_found:,}")
 print(f"  Unique games:              {len(games_dict):,}")
+if errors:
+    print(f"  ⚠️  {len(errors)} files failed to read, e.g. {errors[0][0]}: {errors[0][1]}")
 
 # Now check merged database
 print(f"\n{'='*80}")
@@ -67,11 +114,15 @@ print("MERGED DATABASE COMPARISON")
 print(f"{'='*80}")
 
 if os.path.exists('ps2_cheats_database_merged.json'):
-    with open('ps2_cheats_database_merged.json') as f:
-        db = json.load(f)
-    
-    db_games = len(db.get('games', []))
-    db_cheats = sum(len(r.get('cheats', [])) for g in db['games'] for r in g.get('regions', {}).values())
+    db_games = 0
+    db_cheats = 0
+    with open('ps2_cheats_database_merged.json', 'rb') as f:
+        # without ijson, parse the whole file in one go (orjson when installed, see _fastjson.py)
+        games = ijson.items(f, 'games.item') if ijson is not None else loads(f.read()).get('games', [])
+        for g in games:
+            db_games += 1
+            for r in g.get('regions', {}).values():
+                db_cheats += len(r.get('cheats') or ())
     
     print(f"\n📦 MERGED DATABASE:")
     print(f"  Games in database:         {db_games:,}")